@@ -13,7 +13,11 @@ from backend.config import get_settings
 
 settings = get_settings()
 
-# Create async engine with connection pooling (tuned for production)
+# Create async engine with connection pooling (tuned for production).
+# Every API and worker process gets its own pool, so Postgres
+# max_connections must cover (pool_size + max_overflow) per process:
+# 50 per API worker, per prefork worker child (--concurrency of them per
+# host) and per threads-pool notifications worker.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
@@ -22,6 +26,13 @@ engine = create_async_engine(
     max_overflow=30,
     pool_timeout=30,
     pool_recycle=1800,  # Recycle connections every 30 minutes
+    # Hand out the most recently returned connection first, so a quiet
+    # process keeps reusing a few warm backends and the rest idle out.
+    pool_use_lifo=True,
+    # All timestamp columns are TIMESTAMPTZ written from now()/utcnow() and
+    # read back as UTC. Pinning the session timezone keeps Postgres from
+    # converting to the server's local zone on every row we read.
+    connect_args={"server_settings": {"timezone": "UTC"}},
 )
 
 # Session factory
@@ -4,13 +4,17 @@ Role-Based Access Control Middleware
 Manages roles, permissions, and authorization for multi-tenant access.
 """
 
+import hashlib
 import logging
+import string
+import time
+from collections.abc import Iterable
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException, Request, Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,9 @@ class Role(str, Enum):
     API_KEY = "api_key"
 
 
+_ROLE_BY_VALUE: dict[str, Role] = {role.value: role for role in Role}
+
+
 class Permission(str, Enum):
     """Granular permissions."""
     # Organizations
@@ -64,10 +71,10 @@ class Permission(str, Enum):
     ADMIN_SSO = "admin:sso"
 
 
-# Role-permission mapping
-ROLE_PERMISSIONS: dict[Role, set[Permission]] = {
-    Role.OWNER: set(Permission),  # All permissions
-    Role.ADMIN: {
+# Role-permission mapping; frozen so no caller can widen a role by accident.
+ROLE_PERMISSIONS: dict[Role, frozenset[Permission]] = {
+    Role.OWNER: frozenset(Permission),  # All permissions
+    Role.ADMIN: frozenset({
         Permission.ORG_READ, Permission.ORG_WRITE,
         Permission.EMPLOYEE_READ, Permission.EMPLOYEE_WRITE, Permission.EMPLOYEE_PII,
         Permission.CALC_READ, Permission.CALC_CREATE, Permission.CALC_APPROVE, Permission.CALC_FINALIZE,
@@ -75,49 +82,68 @@ ROLE_PERMISSIONS: dict[Role, set[Permission]] = {
         Permission.WRITEBACK_READ, Permission.WRITEBACK_APPROVE, Permission.WRITEBACK_EXECUTE,
         Permission.COMPLIANCE_READ, Permission.COMPLIANCE_EXPORT, Permission.VAULT_READ,
         Permission.ADMIN_USERS, Permission.ADMIN_SETTINGS, Permission.ADMIN_API_KEYS,
-    },
-    Role.MANAGER: {
+    }),
+    Role.MANAGER: frozenset({
         Permission.ORG_READ,
         Permission.EMPLOYEE_READ, Permission.EMPLOYEE_WRITE,
         Permission.CALC_READ, Permission.CALC_CREATE, Permission.CALC_APPROVE,
         Permission.INTEGRATION_READ, Permission.INTEGRATION_SYNC,
         Permission.WRITEBACK_READ, Permission.WRITEBACK_APPROVE,
         Permission.COMPLIANCE_READ, Permission.COMPLIANCE_EXPORT, Permission.VAULT_READ,
-    },
-    Role.VIEWER: {
+    }),
+    Role.VIEWER: frozenset({
         Permission.ORG_READ,
         Permission.EMPLOYEE_READ,
         Permission.CALC_READ,
         Permission.INTEGRATION_READ,
         Permission.WRITEBACK_READ,
         Permission.COMPLIANCE_READ, Permission.VAULT_READ,
-    },
-    Role.API_KEY: {
+    }),
+    Role.API_KEY: frozenset({
         Permission.ORG_READ,
         Permission.EMPLOYEE_READ,
         Permission.CALC_READ, Permission.CALC_CREATE,
         Permission.INTEGRATION_READ,
-    },
+    }),
 }
 
 
+# One bit per permission; fewer than 64, so a whole grant fits in one word.
+PERMISSION_BITS: dict[Permission, int] = {p: 1 << i for i, p in enumerate(Permission)}
+
+
+def permission_mask(permissions: Iterable[Permission]) -> int:
+    """OR together the bits of ``permissions``."""
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
 class CurrentUser(BaseModel):
     """Authenticated user context."""
     id: UUID
     email: str
     organization_id: UUID
     role: Role
-    permissions: set[Permission] = Field(default_factory=set)
+    permissions: frozenset[Permission] = Field(default_factory=frozenset)
     is_api_key: bool = False
 
+    # Bitmask of ``permissions``; the has_* checks test bits instead of hashing.
+    _mask: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._mask = permission_mask(self.permissions)
+
     def has_permission(self, permission: Permission) -> bool:
-        return permission in self.permissions
+        return bool(self._mask & PERMISSION_BITS[permission])
 
     def has_any_permission(self, *permissions: Permission) -> bool:
-        return any(p in self.permissions for p in permissions)
+        return bool(self._mask & permission_mask(permissions))
 
     def has_all_permissions(self, *permissions: Permission) -> bool:
-        return all(p in self.permissions for p in permissions)
+        wanted = permission_mask(permissions)
+        return self._mask & wanted == wanted
 
 
 async def get_current_user(request: Request) -> CurrentUser:
@@ -186,23 +212,55 @@ def require_org_access(org_id_param: str = "org_id"):
     return check
 
 
+# Recently validated JWTs, keyed by the token's SHA-256 digest. An entry is
+# trusted for at most _TOKEN_CACHE_TTL seconds and never past the token's own
+# exp claim; failures are never cached.
+_TOKEN_CACHE_TTL = 30.0
+_TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: dict[bytes, tuple[CurrentUser, float]] = {}
+
+# A compact JWS is three base64url segments joined by dots; anything else is
+# rejected before hashing or signature verification.
+_JWT_CHARS = frozenset(string.ascii_letters + string.digits + "-_.")
+
+
 async def _validate_token(token: str) -> CurrentUser:
     """Validate JWT token and return user context."""
     import jwt
 
     from backend.config import get_settings
 
+    if token.count(".") != 2 or not _JWT_CHARS.issuperset(token):
+        raise HTTPException(status_code=401, detail="Invalid token: malformed JWT")
+
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > now:
+            return user
+        del _token_cache[key]
+
     secret = get_settings().secret_key
 
     try:
-        payload = jwt.decode(token, secret, algorithms=["HS256"])
+        payload = jwt.decode(
+            token,
+            secret,
+            algorithms=["HS256"],
+            options={"require": ["exp", "sub", "org_id"]},
+        )
     except jwt.InvalidTokenError as e:
         raise HTTPException(status_code=401, detail=f"Invalid token: {e}")
 
-    role = Role(payload.get("role", "viewer"))
-    permissions = ROLE_PERMISSIONS.get(role, set())
+    try:
+        role = _ROLE_BY_VALUE[payload.get("role", "viewer")]
+    except (KeyError, TypeError):
+        raise HTTPException(status_code=401, detail="Invalid token: unknown role")
+    permissions = ROLE_PERMISSIONS.get(role, frozenset())
 
-    return CurrentUser(
+    user = CurrentUser(
         id=UUID(payload["sub"]),
         email=payload.get("email", ""),
         organization_id=UUID(payload["org_id"]),
@@ -210,10 +268,15 @@ async def _validate_token(token: str) -> CurrentUser:
         permissions=permissions,
     )
 
+    if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+        # Dicts keep insertion order, so this evicts the oldest entry.
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[key] = (user, min(now + _TOKEN_CACHE_TTL, payload["exp"]))
+    return user
+
 
 async def _validate_api_key(api_key: str) -> CurrentUser:
     """Validate API key by hashing and looking up in the database."""
-    import hashlib
     from datetime import datetime, timezone
 
     from sqlalchemy import select
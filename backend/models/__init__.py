@@ -6,10 +6,10 @@ from backend.models.calculation_run import CalculationRun
 from backend.models.compliance_vault import ComplianceVault
 from backend.models.employee import Employee
 from backend.models.employee_calculation import EmployeeCalculation
-from backend.models.integration import Integration
+from backend.models.integration import Integration, IntegrationOAuthState
 from backend.models.organization import Organization
 from backend.models.ttoc_classification import TTOCClassification
-from backend.models.user import User
+from backend.models.user import User, UserInvite
 
 __all__ = [
     "Base",
@@ -21,7 +21,9 @@ __all__ = [
     "CalculationRun",
     "EmployeeCalculation",
     "Integration",
+    "IntegrationOAuthState",
     "ComplianceVault",
     "TTOCClassification",
     "User",
+    "UserInvite",
 ]
@@ -12,7 +12,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from backend.models.base import Base, TimestampMixin
+from backend.models.base import Base, Sha256Digest, TimestampMixin
 
 
 class APIKey(TimestampMixin, Base):
@@ -36,7 +36,6 @@ class APIKey(TimestampMixin, Base):
     organization_id: Mapped[UUID] = mapped_column(
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Creator
@@ -53,10 +52,9 @@ class APIKey(TimestampMixin, Base):
         comment="Human-readable name for the key",
     )
     key_hash: Mapped[str] = mapped_column(
-        String(64),
+        Sha256Digest(),
         unique=True,
         nullable=False,
-        index=True,
         comment="SHA-256 hash of the full API key",
     )
     key_prefix: Mapped[str] = mapped_column(
@@ -4,12 +4,67 @@ Base Model Classes and Mixins
 Provides foundational patterns for all SafeHarbor database models.
 """
 
+import os
+import time
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DDL, DateTime, FetchedValue, LargeBinary, event, func
+from sqlalchemy.dialects.postgresql import DOMAIN
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The 48-bit millisecond timestamp prefix keeps primary-key inserts on
+    append-heavy tables clustered on the right-hand B-tree leaf pages.
+    Mirrors the ``uuidv7()`` SQL function installed by the initial migration.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
+
+
+# One length check shared by every digest column instead of a CHECK per column.
+SHA256_DIGEST_DOMAIN = DOMAIN(
+    "sha256_digest",
+    LargeBinary(),
+    check="octet_length(VALUE) = 32",
+)
+
+
+class Sha256Digest(TypeDecorator):
+    """
+    SHA-256 digest stored as a raw 32-byte BYTEA (``sha256_digest`` domain).
+
+    Halves the column and index width versus a 64-char hex VARCHAR while the
+    application keeps working with ``hexdigest()`` strings: values are
+    decoded on bind and re-encoded to lowercase hex on load.
+    """
+
+    impl = SHA256_DIGEST_DOMAIN
+    cache_ok = True
+
+    def process_bind_param(self, value: str | bytes | None, dialect: Any) -> bytes | None:
+        if value is None or isinstance(value, bytes):
+            return value
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Any) -> str | None:
+        if value is None:
+            return None
+        return bytes(value).hex()
+
+
+# Extensions the schema relies on (CITEXT emails, updated_at triggers).
+# The initial migration installs the same set.
+POSTGRES_EXTENSIONS = ("citext", "moddatetime")
 
 
 class Base(DeclarativeBase):
@@ -22,13 +77,25 @@ class Base(DeclarativeBase):
     type_annotation_map: dict[type, Any] = {}
 
 
+for _extension in POSTGRES_EXTENSIONS:
+    event.listen(
+        Base.metadata,
+        "before_create",
+        DDL(f"CREATE EXTENSION IF NOT EXISTS {_extension}").execute_if(dialect="postgresql"),
+    )
+
+
 class TimestampMixin:
     """
     Mixin for automatic created_at and updated_at timestamps.
 
-    Automatically sets created_at on insert and updated_at on every update.
+    created_at is set on insert; updated_at is bumped by a moddatetime
+    BEFORE UPDATE trigger and read back via RETURNING, so UPDATEs don't
+    have to carry the timestamp.
     """
 
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -38,12 +105,26 @@ class TimestampMixin:
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
         comment="Timestamp when record was last updated",
     )
 
 
+@event.listens_for(TimestampMixin, "instrument_class", propagate=True)
+def _add_moddatetime_trigger(mapper: Any, class_: type) -> None:
+    """Install the updated_at trigger whenever a timestamped table is created."""
+    table = mapper.local_table
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_{table.name}_moddatetime BEFORE UPDATE ON {table.name} "
+            "FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at)"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
 class AuditMixin:
     """
     Mixin for full audit trail with Compliance Vault reference.
@@ -9,13 +9,13 @@ from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import CheckConstraint, ForeignKey, Index, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Numeric, Text, text
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from backend.models.base import AuditMixin, Base, TimestampMixin
+from backend.models.base import AuditMixin, Base, TimestampMixin, uuid7
 
 if TYPE_CHECKING:
     from backend.models.employee_calculation import EmployeeCalculation
@@ -65,7 +65,7 @@ class CalculationRun(TimestampMixin, AuditMixin, Base):
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     organization_id: Mapped[UUID] = mapped_column(
         ForeignKey("organizations.id", ondelete="CASCADE"),
@@ -74,7 +74,7 @@ class CalculationRun(TimestampMixin, AuditMixin, Base):
 
     # Run identification
     run_type: Mapped[str] = mapped_column(
-        String(30),
+        ENUM(*(t.value for t in RunType), name="run_type"),
         nullable=False,
         comment="Run type: pay_period|quarterly|annual|ad_hoc|retro_audit",
     )
@@ -93,7 +93,7 @@ class CalculationRun(TimestampMixin, AuditMixin, Base):
 
     # State machine
     status: Mapped[str] = mapped_column(
-        String(30),
+        ENUM(*(s.value for s in RunStatus), name="run_status"),
         default=RunStatus.PENDING.value,
         nullable=False,
         comment="Run status: pending|syncing|calculating|pending_approval|approved|rejected|finalized|error",
@@ -236,17 +236,22 @@ class CalculationRun(TimestampMixin, AuditMixin, Base):
             "period_end >= period_start",
             name="valid_period_range",
         ),
-        CheckConstraint(
-            "run_type IN ('pay_period', 'quarterly', 'annual', 'ad_hoc', 'retro_audit')",
-            name="valid_run_type",
+        Index("ix_calculation_runs_status", "status"),
+        Index(
+            "ix_calculation_runs_pending",
+            "organization_id",
+            "created_at",
+            postgresql_where=text(
+                "status IN ('pending', 'syncing', 'calculating', 'pending_approval')"
+            ),
         ),
-        CheckConstraint(
-            "status IN ('pending', 'syncing', 'calculating', 'pending_approval', 'approved', 'rejected', 'finalized', 'error')",
-            name="valid_run_status",
+        Index(
+            "ix_calculation_runs_org_period",
+            "organization_id",
+            "period_start",
+            "period_end",
+            postgresql_include=["status", "total_employees", "processed_employees", "tax_year"],
         ),
-        Index("ix_calculation_runs_org_id", "organization_id"),
-        Index("ix_calculation_runs_status", "status"),
-        Index("ix_calculation_runs_org_period", "organization_id", "period_start", "period_end"),
         Index("ix_calculation_runs_tax_year", "organization_id", "tax_year"),
     )
 
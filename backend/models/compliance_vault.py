@@ -7,13 +7,13 @@ Immutable audit ledger with hash chain integrity.
 
 from datetime import datetime, timedelta
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import CheckConstraint, ForeignKey, Index, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import CheckConstraint, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from backend.models.base import Base
+from backend.models.base import Base, Sha256Digest, uuid7
 
 
 class VaultEntryType(str, Enum):
@@ -79,21 +79,26 @@ class ComplianceVault(Base):
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
 
     # Hash chain for integrity verification
     entry_hash: Mapped[str] = mapped_column(
-        String(64),
+        Sha256Digest(),
         unique=True,
         nullable=False,
         comment="SHA-256 hash of entry content (JSON-serialized)",
     )
     previous_hash: Mapped[str | None] = mapped_column(
-        String(64),
+        Sha256Digest(),
         nullable=True,
         comment="Hash of previous entry in chain (null for genesis)",
     )
+    previous_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("compliance_vault.id"),
+        nullable=True,
+        comment="Previous entry in chain (null for genesis); compact link for traversal",
+    )
     sequence_number: Mapped[int] = mapped_column(
         nullable=False,
         comment="Monotonically increasing sequence number per organization",
@@ -128,7 +133,7 @@ class ComplianceVault(Base):
         comment="Full snapshot of state at this point",
     )
     content_hash: Mapped[str] = mapped_column(
-        String(64),
+        Sha256Digest(),
         nullable=False,
         comment="SHA-256 hash of content JSON for tamper detection",
     )
@@ -159,7 +164,7 @@ class ComplianceVault(Base):
         comment="User/system ID that triggered this entry",
     )
     actor_type: Mapped[str] = mapped_column(
-        String(20),
+        ENUM(*(a.value for a in ActorType), name="actor_type"),
         default=ActorType.SYSTEM.value,
         nullable=False,
         comment="Type of actor: user|system|integration|calculation_engine",
@@ -182,25 +187,32 @@ class ComplianceVault(Base):
     )
 
     __table_args__ = (
-        CheckConstraint(
-            "entry_hash ~ '^[a-f0-9]{64}$'",
-            name="valid_entry_hash",
-        ),
-        CheckConstraint(
-            "previous_hash IS NULL OR previous_hash ~ '^[a-f0-9]{64}$'",
-            name="valid_previous_hash",
-        ),
         CheckConstraint(
             "retention_expires_at > created_at",
             name="valid_retention_date",
         ),
-        Index("ix_compliance_vault_org_id", "organization_id"),
+        UniqueConstraint(
+            "organization_id",
+            "sequence_number",
+            name="uq_vault_org_seq",
+        ),
         Index("ix_compliance_vault_entry_type", "entry_type"),
-        Index("ix_compliance_vault_created_at", "created_at"),
+        # Append-only: timestamps follow physical order, so BRIN suffices
+        Index(
+            "ix_compliance_vault_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_compliance_vault_employee_id", "employee_id"),
         Index("ix_compliance_vault_calculation_run_id", "calculation_run_id"),
-        Index("ix_compliance_vault_retention", "retention_expires_at"),
-        Index("ix_compliance_vault_org_sequence", "organization_id", "sequence_number"),
+        Index(
+            "ix_compliance_vault_retention_brin",
+            "retention_expires_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_compliance_vault_previous_id", "previous_id"),
     )
 
     def __repr__(self) -> str:
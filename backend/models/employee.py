@@ -6,15 +6,16 @@ Links payroll data, tip information, and occupation classification.
 """
 
 from datetime import date, datetime
+from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, Index, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import ForeignKey, Index, Numeric, String, Text, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from backend.models.base import AuditMixin, Base, TimestampMixin
+from backend.models.base import AuditMixin, Base, Sha256Digest, TimestampMixin
 
 if TYPE_CHECKING:
     from backend.models.employee_calculation import EmployeeCalculation
@@ -77,7 +78,7 @@ class Employee(TimestampMixin, AuditMixin, Base):
         nullable=False,
     )
     ssn_hash: Mapped[str] = mapped_column(
-        String(64),
+        Sha256Digest(),
         nullable=False,
         comment="SHA-256 hash of SSN for matching without storing raw value",
     )
@@ -90,7 +91,7 @@ class Employee(TimestampMixin, AuditMixin, Base):
         nullable=True,
     )
     employment_status: Mapped[str] = mapped_column(
-        String(20),
+        ENUM(*(s.value for s in EmploymentStatus), name="employment_status"),
         default=EmploymentStatus.ACTIVE.value,
         nullable=False,
         comment="Employment status: active|terminated|leave",
@@ -119,7 +120,8 @@ class Employee(TimestampMixin, AuditMixin, Base):
     )
 
     # Pay information
-    hourly_rate: Mapped[float | None] = mapped_column(
+    hourly_rate: Mapped[Decimal | None] = mapped_column(
+        Numeric(8, 4),
         nullable=True,
         comment="Primary hourly rate (may have multiple rates per shift)",
     )
@@ -161,30 +163,36 @@ class Employee(TimestampMixin, AuditMixin, Base):
         nullable=True,
         comment="Tax filing status for phase-out: single|married_joint|married_separate|head_of_household",
     )
-    estimated_annual_magi: Mapped[float | None] = mapped_column(
+    estimated_annual_magi: Mapped[Decimal | None] = mapped_column(
+        Numeric(12, 2),
         nullable=True,
         comment="Estimated Modified Adjusted Gross Income for phase-out calculations",
     )
 
     # Year-to-date tracking
-    ytd_gross_wages: Mapped[float] = mapped_column(
-        default=0.0,
+    ytd_gross_wages: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0"),
         comment="Year-to-date gross wages",
     )
-    ytd_overtime_hours: Mapped[float] = mapped_column(
-        default=0.0,
+    ytd_overtime_hours: Mapped[Decimal] = mapped_column(
+        Numeric(8, 2),
+        default=Decimal("0"),
         comment="Year-to-date overtime hours",
     )
-    ytd_tips: Mapped[float] = mapped_column(
-        default=0.0,
+    ytd_tips: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0"),
         comment="Year-to-date tips received",
     )
-    ytd_qualified_ot_premium: Mapped[float] = mapped_column(
-        default=0.0,
+    ytd_qualified_ot_premium: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0"),
         comment="Year-to-date qualified overtime premium (OBBB)",
     )
-    ytd_qualified_tips: Mapped[float] = mapped_column(
-        default=0.0,
+    ytd_qualified_tips: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0"),
         comment="Year-to-date qualified tips (OBBB)",
     )
 
@@ -208,10 +216,21 @@ class Employee(TimestampMixin, AuditMixin, Base):
             "ssn_hash",
             name="uq_employee_org_ssn",
         ),
-        Index("ix_employees_organization_id", "organization_id"),
         Index("ix_employees_employment_status", "employment_status"),
         Index("ix_employees_ttoc_code", "ttoc_code"),
-        Index("ix_employees_org_status", "organization_id", "employment_status"),
+        Index(
+            "ix_employees_org_status",
+            "organization_id",
+            "employment_status",
+            postgresql_include=["first_name", "last_name", "ttoc_code", "hire_date"],
+        ),
+        # Weekly phase-out risk check: active employees above a YTD threshold
+        Index(
+            "ix_employees_active_ytd_wages",
+            "ytd_gross_wages",
+            postgresql_include=["organization_id", "filing_status"],
+            postgresql_where=text("employment_status = 'active'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -8,13 +8,13 @@ Stores all calculated values and full audit trail.
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import ForeignKey, Index, Numeric, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from backend.models.base import Base, TimestampMixin
+from backend.models.base import Base, Sha256Digest, TimestampMixin, uuid7
 
 if TYPE_CHECKING:
     from backend.models.calculation_run import CalculationRun
@@ -53,17 +53,24 @@ class EmployeeCalculation(TimestampMixin, Base):
 
     This record is effectively immutable once created; corrections
     result in new calculation runs rather than modifications.
+
+    In PostgreSQL the table is hash-partitioned on calculation_run_id,
+    with partitions at fillfactor 90 and clustered on uq_run_employee. The
+    JSONB trace columns are TOAST-compressed (lz4 where available) from
+    512-byte rows up; see migration a001.
     """
 
     __tablename__ = "employee_calculations"
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
+    # Part of the primary key: a partitioned table's PK must include the
+    # partition key.
     calculation_run_id: Mapped[UUID] = mapped_column(
         ForeignKey("calculation_runs.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
     )
     employee_id: Mapped[UUID] = mapped_column(
         ForeignKey("employees.id", ondelete="CASCADE"),
@@ -280,7 +287,7 @@ class EmployeeCalculation(TimestampMixin, Base):
         comment="Complete calculation inputs/outputs for reproducibility",
     )
     input_data_hash: Mapped[str | None] = mapped_column(
-        String(64),
+        Sha256Digest(),
         nullable=True,
         comment="SHA-256 hash of source data for integrity verification",
     )
@@ -305,7 +312,6 @@ class EmployeeCalculation(TimestampMixin, Base):
             "employee_id",
             name="uq_run_employee",
         ),
-        Index("ix_employee_calculations_run_id", "calculation_run_id"),
         Index("ix_employee_calculations_employee_id", "employee_id"),
         Index("ix_employee_calculations_status", "status"),
     )
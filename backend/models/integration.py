@@ -10,7 +10,16 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, Index, LargeBinary, String, Text, UniqueConstraint
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -137,11 +146,6 @@ class Integration(TimestampMixin, Base):
     )
 
     # OAuth metadata
-    oauth_state: Mapped[str | None] = mapped_column(
-        String(255),
-        nullable=True,
-        comment="OAuth state parameter for CSRF protection",
-    )
     scopes: Mapped[list] = mapped_column(
         JSONB,
         default=list,
@@ -235,7 +239,6 @@ class Integration(TimestampMixin, Base):
             "provider",
             name="uq_org_provider",
         ),
-        Index("ix_integrations_organization_id", "organization_id"),
         Index("ix_integrations_provider", "provider"),
         Index("ix_integrations_status", "status"),
         Index("ix_integrations_next_sync", "next_sync_at"),
@@ -262,3 +265,32 @@ class Integration(TimestampMixin, Base):
     def can_sync(self) -> bool:
         """Check if integration can be synced."""
         return self.is_connected and self.access_token_encrypted is not None
+
+
+class IntegrationOAuthState(Base):
+    """
+    Pending OAuth state parameter for CSRF protection.
+
+    Written when a connection is initiated and deleted by the callback,
+    so it never widens the integrations row that sync jobs read.
+    """
+
+    __tablename__ = "integration_oauth_states"
+
+    integration_id: Mapped[UUID] = mapped_column(
+        ForeignKey("integrations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    state: Mapped[str] = mapped_column(
+        String(255),
+        unique=True,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<IntegrationOAuthState integration={self.integration_id}>"
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from sqlalchemy import CheckConstraint, Index, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin
@@ -39,6 +39,9 @@ class OrganizationStatus(str, Enum):
     CLOSED = "closed"
 
 
+WORKWEEK_DAYS = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+
+
 class Organization(TimestampMixin, Base):
     """
     Multi-tenant organization record.
@@ -73,7 +76,7 @@ class Organization(TimestampMixin, Base):
 
     # Subscription
     tier: Mapped[str] = mapped_column(
-        String(20),
+        ENUM(*(t.value for t in OrganizationTier), name="org_tier"),
         default=OrganizationTier.STARTER.value,
         nullable=False,
         comment="Subscription tier: starter|pro|enterprise",
@@ -95,7 +98,7 @@ class Organization(TimestampMixin, Base):
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(20),
+        ENUM(*(s.value for s in OrganizationStatus), name="org_status"),
         default=OrganizationStatus.ACTIVE.value,
         nullable=False,
         comment="Account status: active|suspended|closed",
@@ -103,7 +106,7 @@ class Organization(TimestampMixin, Base):
 
     # FLSA Configuration
     workweek_start: Mapped[str] = mapped_column(
-        String(10),
+        ENUM(*WORKWEEK_DAYS, name="workweek_day"),
         default="sunday",
         nullable=False,
         comment="FLSA workweek start day (sunday-saturday)",
@@ -160,19 +163,6 @@ class Organization(TimestampMixin, Base):
             "ein ~ '^[0-9]{2}-[0-9]{7}$'",
             name="valid_ein_format",
         ),
-        CheckConstraint(
-            "tier IN ('starter', 'pro', 'enterprise')",
-            name="valid_tier",
-        ),
-        CheckConstraint(
-            "status IN ('active', 'suspended', 'closed')",
-            name="valid_status",
-        ),
-        CheckConstraint(
-            "workweek_start IN ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday')",
-            name="valid_workweek_start",
-        ),
-        Index("ix_organizations_ein", "ein"),
         Index("ix_organizations_status", "status"),
     )
 
@@ -6,13 +6,13 @@ Tracks AI decisions with full determinism envelope.
 """
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from backend.models.base import Base, TimestampMixin
+from backend.models.base import Base, Sha256Digest, TimestampMixin, uuid7
 
 
 class TTOCClassification(TimestampMixin, Base):
@@ -33,10 +33,17 @@ class TTOCClassification(TimestampMixin, Base):
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     employee_id: Mapped[UUID] = mapped_column(
-        ForeignKey("employees.id", ondelete="CASCADE"),
+        # employees.ttoc_classification_id points back here; emitting this
+        # side as ALTER TABLE breaks the cycle for create_all/drop_all.
+        ForeignKey(
+            "employees.id",
+            ondelete="CASCADE",
+            use_alter=True,
+            name="fk_ttoc_classifications_employee_id",
+        ),
         nullable=False,
     )
 
@@ -123,12 +130,12 @@ class TTOCClassification(TimestampMixin, Base):
         comment="Version of classification prompt (e.g., v1.0.0)",
     )
     prompt_hash: Mapped[str] = mapped_column(
-        String(64),
+        Sha256Digest(),
         nullable=False,
         comment="SHA-256 hash of the full prompt for reproducibility",
     )
     response_hash: Mapped[str] = mapped_column(
-        String(64),
+        Sha256Digest(),
         nullable=False,
         comment="SHA-256 hash of raw LLM response",
     )
@@ -201,9 +208,7 @@ class TTOCClassification(TimestampMixin, Base):
     )
 
     __table_args__ = (
-        Index("ix_ttoc_classifications_employee_id", "employee_id"),
         Index("ix_ttoc_classifications_ttoc_code", "ttoc_code"),
-        Index("ix_ttoc_classifications_is_active", "is_active"),
         Index("ix_ttoc_classifications_confidence", "confidence_score"),
         Index("ix_ttoc_classifications_employee_active", "employee_id", "is_active"),
     )
@@ -3,13 +3,17 @@ User Model
 
 Authentication and authorization for SafeHarbor users.
 Supports password-based login, SSO, and invite flows.
+
+Pending invite tokens live in their own table so the hot users row
+stays narrow; they are only touched during signup.
 """
 
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import CITEXT, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin
@@ -38,15 +42,14 @@ class User(TimestampMixin, Base):
     organization_id: Mapped[UUID] = mapped_column(
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Identity
     email: Mapped[str] = mapped_column(
-        String(255),
+        CITEXT(),
         unique=True,
         nullable=False,
-        index=True,
+        comment="Case-insensitive; lookups need no lower()",
     )
     name: Mapped[str | None] = mapped_column(
         String(255),
@@ -62,7 +65,7 @@ class User(TimestampMixin, Base):
 
     # Authorization
     role: Mapped[str] = mapped_column(
-        String(50),
+        ENUM("owner", "admin", "manager", "viewer", name="user_role"),
         nullable=False,
         default="viewer",
         comment="Role: owner, admin, manager, viewer",
@@ -87,17 +90,6 @@ class User(TimestampMixin, Base):
         nullable=True,
     )
 
-    # Invite flow
-    invite_token: Mapped[str | None] = mapped_column(
-        String(255),
-        nullable=True,
-        unique=True,
-    )
-    invite_expires_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-    )
-
     # SSO
     sso_provider: Mapped[str | None] = mapped_column(
         String(100),
@@ -122,3 +114,35 @@ class User(TimestampMixin, Base):
 
     def __repr__(self) -> str:
         return f"<User {self.email} role={self.role}>"
+
+
+class UserInvite(Base):
+    """
+    Outstanding invite token for a user who has not yet signed up.
+
+    One row per invited user, deleted when the invite is accepted.
+    """
+
+    __tablename__ = "user_invites"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    token: Mapped[str] = mapped_column(
+        String(255),
+        unique=True,
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserInvite user={self.user_id} expires={self.expires_at}>"
@@ -25,7 +25,7 @@ from backend.middleware.rbac import (
 )
 from backend.models.api_key import APIKey
 from backend.models.organization import Organization
-from backend.models.user import User
+from backend.models.user import User, UserInvite
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -93,12 +93,17 @@ async def invite_user(
         role=request.role,
         is_active=False,  # Activated when invite is accepted
         is_verified=False,
-        invite_token=invite_token,
-        invite_expires_at=datetime.now(timezone.utc) + timedelta(days=7),
     )
     db.add(new_user)
     await db.flush()
 
+    db.add(UserInvite(
+        user_id=new_user.id,
+        token=invite_token,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+    ))
+    await db.flush()
+
     return UserResponse.model_validate(new_user)
 
 
@@ -18,6 +18,7 @@ from backend.middleware.rbac import (
 )
 from backend.models.integration import (
     Integration,
+    IntegrationOAuthState,
     IntegrationProvider,
     IntegrationStatus,
     PROVIDER_CATEGORIES,
@@ -159,7 +160,7 @@ async def connect_integration(
     import secrets as _secrets
 
     oauth_state = _secrets.token_urlsafe(32)
-    integration.oauth_state = oauth_state
+    db.add(IntegrationOAuthState(integration_id=integration.id, state=oauth_state))
     await db.flush()
 
     # Build real OAuth authorization URL
@@ -215,10 +216,12 @@ async def oauth_callback(
     user: CurrentUser = Depends(require_permission(Permission.INTEGRATION_WRITE)),
 ) -> dict:
     """Handle OAuth callback."""
-    # State should be the integration ID
-    try:
-        integration_id = UUID(state)
-    except ValueError:
+    # State maps back to the pending integration
+    state_result = await db.execute(
+        select(IntegrationOAuthState).where(IntegrationOAuthState.state == state)
+    )
+    oauth_state = state_result.scalar_one_or_none()
+    if not oauth_state:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid state parameter",
@@ -226,7 +229,7 @@ async def oauth_callback(
 
     result = await db.execute(
         select(Integration).where(
-            Integration.id == integration_id,
+            Integration.id == oauth_state.integration_id,
             Integration.organization_id == org_id,
         )
     )
@@ -297,7 +300,7 @@ async def oauth_callback(
 
     integration.status = IntegrationStatus.CONNECTED.value
     integration.scopes = oauth_config["scopes"]
-    integration.oauth_state = None  # Clear state after use
+    await db.delete(oauth_state)  # Clear state after use
 
     await db.flush()
 
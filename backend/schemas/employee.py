@@ -32,12 +32,12 @@ class EmployeeCreate(EmployeeBase):
     job_description: str | None = None
     department: str | None = Field(default=None, max_length=100)
     duties: list[str] = Field(default_factory=list)
-    hourly_rate: float | None = Field(default=None, ge=0)
+    hourly_rate: Decimal | None = Field(default=None, ge=0)
     is_hourly: bool = True
     filing_status: Literal[
         "single", "married_joint", "married_separate", "head_of_household"
     ] | None = None
-    estimated_annual_magi: float | None = Field(default=None, ge=0)
+    estimated_annual_magi: Decimal | None = Field(default=None, ge=0)
     external_ids: dict[str, str] = Field(
         default_factory=dict,
         description="External system IDs (e.g., {'adp': '123', 'toast': '456'})",
@@ -53,14 +53,14 @@ class EmployeeUpdate(BaseModel):
     job_description: str | None = None
     department: str | None = Field(default=None, max_length=100)
     duties: list[str] | None = None
-    hourly_rate: float | None = Field(default=None, ge=0)
+    hourly_rate: Decimal | None = Field(default=None, ge=0)
     is_hourly: bool | None = None
     employment_status: Literal["active", "terminated", "leave"] | None = None
     termination_date: date | None = None
     filing_status: Literal[
         "single", "married_joint", "married_separate", "head_of_household"
     ] | None = None
-    estimated_annual_magi: float | None = Field(default=None, ge=0)
+    estimated_annual_magi: Decimal | None = Field(default=None, ge=0)
     external_ids: dict[str, str] | None = None
 
 
@@ -71,6 +71,21 @@ async def set_cached(key: str, value: Any, ttl: int = TTL_SHORT) -> bool:
         return False
 
 
+async def claim(key: str, ttl: int) -> bool:
+    """
+    Atomically claim a key for ``ttl`` seconds (SET NX).
+
+    Returns False if another caller already holds it. Fails open, returning
+    True when Redis is unavailable, so callers never drop work over it.
+    """
+    try:
+        r = await _get_redis()
+        return bool(await r.set(key, "1", nx=True, ex=ttl))
+    except Exception as e:
+        logger.debug(f"Cache claim failed: {key} — {e}")
+        return True
+
+
 async def invalidate(key: str) -> bool:
     """Delete a cached key."""
     try:
@@ -127,3 +142,8 @@ def calc_run_key(org_id: str, run_id: str) -> str:
 def integration_list_key(org_id: str) -> str:
     """Cache key for integration list."""
     return f"integrations:{org_id}"
+
+
+def notification_key(kind: str, *parts: Any) -> str:
+    """Dedup key for a notification of ``kind`` about ``parts``."""
+    return ":".join(["notif", kind, *(str(p) for p in parts)])
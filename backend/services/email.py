@@ -7,6 +7,7 @@ Supports user invitations, calculation alerts, anomaly warnings, and sync failur
 
 import logging
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -24,6 +25,43 @@ SMTP_PASSWORD = getattr(settings, "smtp_password", "")
 FROM_EMAIL = getattr(settings, "from_email", "notifications@safeharbor.ai")
 FROM_NAME = "SafeHarbor AI"
 
+# One SMTP connection per process, reused across sends so each email skips
+# the connect/STARTTLS/login handshake. Senders may run on several threads
+# (asyncio.to_thread, threads-pool workers), so the lock serializes them.
+_smtp_conn: smtplib.SMTP | None = None
+_smtp_lock = threading.Lock()
+
+
+def _connect() -> smtplib.SMTP:
+    """Open and authenticate a new SMTP connection."""
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    server.starttls()
+    if SMTP_USER and SMTP_PASSWORD:
+        server.login(SMTP_USER, SMTP_PASSWORD)
+    return server
+
+
+def _deliver(to: str, message: str) -> None:
+    """Send a message on the shared connection, reconnecting once if dropped."""
+    global _smtp_conn
+    with _smtp_lock:
+        try:
+            if _smtp_conn is None:
+                _smtp_conn = _connect()
+            try:
+                _smtp_conn.sendmail(FROM_EMAIL, to, message)
+            except smtplib.SMTPServerDisconnected:
+                # Servers close idle connections; retry once on a fresh one
+                _smtp_conn = _connect()
+                _smtp_conn.sendmail(FROM_EMAIL, to, message)
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # The server answered (e.g. rejected this recipient), so the
+            # connection is still usable
+            raise
+        except Exception:
+            _smtp_conn = None
+            raise
+
 
 def _send_email(to: str, subject: str, html_body: str, text_body: str | None = None) -> bool:
     """
@@ -47,11 +85,7 @@ def _send_email(to: str, subject: str, html_body: str, text_body: str | None = N
             msg.attach(MIMEText(text_body, "plain"))
         msg.attach(MIMEText(html_body, "html"))
 
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.starttls()
-            if SMTP_USER and SMTP_PASSWORD:
-                server.login(SMTP_USER, SMTP_PASSWORD)
-            server.sendmail(FROM_EMAIL, to, msg.as_string())
+        _deliver(to, msg.as_string())
 
         logger.info(f"Email sent to {to}: {subject}")
         return True
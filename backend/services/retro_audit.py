@@ -6,6 +6,7 @@ estimated and correct OBBB tax exemption values.
 """
 
 import logging
+from bisect import bisect_right
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -16,6 +17,12 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal("0")
+_HALF = Decimal("0.5")
+_OT_ISSUE_THRESHOLD = Decimal("1000")
+_TIP_ISSUE_THRESHOLD = Decimal("500")
+_HIGH_PHASE_OUT_PERCENTAGE = Decimal("50")
+
 
 class RiskLevel(str, Enum):
     """Risk assessment levels."""
@@ -106,6 +113,14 @@ class RetroAuditService:
     DISCREPANCY_THRESHOLD_MEDIUM = Decimal("500")
     DISCREPANCY_THRESHOLD_HIGH = Decimal("2000")
 
+    # Sorted thresholds and the risk level for each band between them.
+    _RISK_THRESHOLDS = (
+        DISCREPANCY_THRESHOLD_LOW,
+        DISCREPANCY_THRESHOLD_MEDIUM,
+        DISCREPANCY_THRESHOLD_HIGH,
+    )
+    _RISK_BANDS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
     def __init__(self, db_session):
         self.db = db_session
 
@@ -154,7 +169,7 @@ class RetroAuditService:
             report.employee_results.append(result)
             report.total_employees_analyzed += 1
 
-            if result.total_discrepancy != Decimal("0"):
+            if result.total_discrepancy != _ZERO:
                 report.employees_with_discrepancies += 1
                 report.total_discrepancy += result.total_discrepancy
                 report.ot_premium_total_discrepancy += result.ot_premium_discrepancy
@@ -167,7 +182,7 @@ class RetroAuditService:
             report.total_correct_credits += result.total_correct
 
         # Calculate penalty exposure
-        underpayment = max(report.total_discrepancy, Decimal("0"))
+        underpayment = max(report.total_discrepancy, _ZERO)
         report.potential_penalty_exposure = (
             underpayment * self.UNDERPAYMENT_PENALTY_RATE
             + underpayment * self.ACCURACY_PENALTY_RATE
@@ -215,25 +230,29 @@ class RetroAuditService:
         )
         employees = emp_result.scalars().all()
 
-        employee_data = []
-        for emp in employees:
-            # Get calculations for this employee in the period
-            calc_result = await self.db.execute(
-                select(EmployeeCalculation)
-                .join(CalculationRun)
-                .where(
-                    EmployeeCalculation.employee_id == emp.id,
-                    CalculationRun.period_start >= period_start,
-                    CalculationRun.period_end <= period_end,
-                    CalculationRun.status == "approved",
-                )
+        # Get every approved calculation in the period in one query rather
+        # than one per employee, then group them by employee.
+        calc_result = await self.db.execute(
+            select(EmployeeCalculation)
+            .join(CalculationRun)
+            .where(
+                CalculationRun.organization_id == org_id,
+                CalculationRun.period_start >= period_start,
+                CalculationRun.period_end <= period_end,
+                CalculationRun.status == "approved",
             )
-            calculations = calc_result.scalars().all()
+        )
+        calculations_by_employee: dict[UUID, list] = {}
+        for calc in calc_result.scalars():
+            calculations_by_employee.setdefault(calc.employee_id, []).append(calc)
 
-            employee_data.append({
+        employee_data = [
+            {
                 "employee": emp,
-                "calculations": calculations,
-            })
+                "calculations": calculations_by_employee.get(emp.id, []),
+            }
+            for emp in employees
+        ]
 
         return employee_data
 
@@ -259,20 +278,20 @@ class RetroAuditService:
             # The "estimated" values are what was originally calculated
             # without SafeHarbor (simple 1.5x assumption)
             estimated_ot = self._estimate_simple_ot_premium(calc)
-            correct_ot = getattr(calc, "qualified_ot_premium", Decimal("0")) or Decimal("0")
+            correct_ot = getattr(calc, "qualified_ot_premium", _ZERO) or _ZERO
 
             result.estimated_ot_premium += estimated_ot
             result.correct_ot_premium += correct_ot
 
             # Tip credits
             estimated_tips = self._estimate_simple_tip_credit(calc)
-            correct_tips = getattr(calc, "qualified_tip_credit", Decimal("0")) or Decimal("0")
+            correct_tips = getattr(calc, "qualified_tip_credit", _ZERO) or _ZERO
 
             result.estimated_tip_credit += estimated_tips
             result.correct_tip_credit += correct_tips
 
             # Phase-out
-            phase_out_pct = getattr(calc, "phase_out_percentage", Decimal("0")) or Decimal("0")
+            phase_out_pct = getattr(calc, "phase_out_percentage", _ZERO) or _ZERO
             result.phase_out_percentage = max(result.phase_out_percentage, phase_out_pct)
 
         # Calculate discrepancies
@@ -299,30 +318,27 @@ class RetroAuditService:
         Estimate OT premium using simple 1.5x method (what employers
         typically calculate without proper FLSA regular rate).
         """
-        hourly_rate = getattr(calc, "hourly_rate", None) or Decimal("0")
-        ot_hours = getattr(calc, "overtime_hours", None) or Decimal("0")
+        hourly_rate = getattr(calc, "hourly_rate", None)
+        ot_hours = getattr(calc, "overtime_hours", None)
+        if not hourly_rate or not ot_hours:
+            return _ZERO
 
         # Simple: employer assumes OT premium is just 0.5x base rate
-        return hourly_rate * Decimal("0.5") * ot_hours
+        return hourly_rate * _HALF * ot_hours
 
     def _estimate_simple_tip_credit(self, calc) -> Decimal:
         """
         Estimate tip credit without proper TTOC classification.
         Most employers don't claim this at all, so estimate is 0.
         """
-        return Decimal("0")
+        return _ZERO
 
     def _assess_risk(self, result: EmployeeAuditResult) -> RiskLevel:
         """Determine risk level based on discrepancy magnitude."""
-        abs_discrepancy = abs(result.total_discrepancy)
-
-        if abs_discrepancy >= self.DISCREPANCY_THRESHOLD_HIGH:
-            return RiskLevel.CRITICAL
-        elif abs_discrepancy >= self.DISCREPANCY_THRESHOLD_MEDIUM:
-            return RiskLevel.HIGH
-        elif abs_discrepancy >= self.DISCREPANCY_THRESHOLD_LOW:
-            return RiskLevel.MEDIUM
-        return RiskLevel.LOW
+        # Thresholds are inclusive lower bounds, hence bisect_right.
+        return self._RISK_BANDS[
+            bisect_right(self._RISK_THRESHOLDS, abs(result.total_discrepancy))
+        ]
 
     def _identify_risk_factors(
         self,
@@ -332,23 +348,23 @@ class RetroAuditService:
         """Identify specific risk factors for an employee."""
         factors = []
 
-        if result.ot_premium_discrepancy > Decimal("0"):
+        if result.ot_premium_discrepancy > _ZERO:
             factors.append(
                 f"OT premium under-calculated by ${result.ot_premium_discrepancy:.2f} "
                 f"(regular rate not properly weighted)"
             )
 
-        if result.ot_premium_discrepancy < Decimal("0"):
+        if result.ot_premium_discrepancy < _ZERO:
             factors.append(
                 f"OT premium over-calculated by ${abs(result.ot_premium_discrepancy):.2f}"
             )
 
-        if result.tip_credit_discrepancy > Decimal("0"):
+        if result.tip_credit_discrepancy > _ZERO:
             factors.append(
                 f"Unclaimed tip credit of ${result.tip_credit_discrepancy:.2f}"
             )
 
-        if result.phase_out_percentage > Decimal("0"):
+        if result.phase_out_percentage > _ZERO:
             factors.append(
                 f"Phase-out reduces credits by {result.phase_out_percentage:.1f}%"
             )
@@ -375,16 +391,16 @@ class RetroAuditService:
         if result.risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL):
             recs.append("Priority: Recalculate and amend affected payroll periods")
 
-        if result.ot_premium_discrepancy != Decimal("0"):
+        if result.ot_premium_discrepancy != _ZERO:
             recs.append("Use weighted average regular rate for OT premium calculation")
 
-        if result.tip_credit_discrepancy > Decimal("0"):
+        if result.tip_credit_discrepancy > _ZERO:
             recs.append("Classify occupation with TTOC code to claim tip credit")
 
         if not result.ttoc_code:
             recs.append("Complete TTOC occupation classification")
 
-        if result.phase_out_percentage > Decimal("50"):
+        if result.phase_out_percentage > _HIGH_PHASE_OUT_PERCENTAGE:
             recs.append("Review MAGI estimate - significant phase-out applies")
 
         return recs
@@ -394,7 +410,7 @@ class RetroAuditService:
         issues = []
 
         # Check for systematic OT miscalculation
-        if abs(report.ot_premium_total_discrepancy) > Decimal("1000"):
+        if abs(report.ot_premium_total_discrepancy) > _OT_ISSUE_THRESHOLD:
             issues.append({
                 "type": "systematic_ot_error",
                 "severity": "high",
@@ -409,7 +425,7 @@ class RetroAuditService:
             })
 
         # Check for unclaimed tip credits
-        if report.tip_credit_total_discrepancy > Decimal("500"):
+        if report.tip_credit_total_discrepancy > _TIP_ISSUE_THRESHOLD:
             issues.append({
                 "type": "unclaimed_tip_credits",
                 "severity": "high",
@@ -423,8 +439,9 @@ class RetroAuditService:
             })
 
         # Check for high-risk employee count
-        critical_count = report.risk_distribution.get("critical", 0)
-        high_count = report.risk_distribution.get("high", 0)
+        risk_distribution = report.risk_distribution
+        critical_count = risk_distribution.get("critical", 0)
+        high_count = risk_distribution.get("high", 0)
         if critical_count + high_count > 0:
             issues.append({
                 "type": "high_risk_employees",
@@ -438,6 +455,9 @@ class RetroAuditService:
                 "recommendation": "Review and correct calculations for flagged employees",
             })
 
+        if not issues:
+            return []
+
         # Sort by impact
         issues.sort(key=lambda x: abs(x.get("impact", 0)), reverse=True)
         return issues[:10]
@@ -19,6 +19,12 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Box 12 arithmetic constants, built once rather than on every calculation.
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+_CENT = Decimal("0.01")
+
 
 class WriteBackStatus(str, Enum):
     """Status of a write-back operation."""
@@ -149,11 +155,13 @@ class WriteBackEngine:
             # Build Box 12 values
             box_12 = self._calculate_box_12_values(calc)
 
-            if any(v > Decimal("0") for v in box_12.values()):
-                record = WriteBackRecord(
+            if any(v > _ZERO for v in box_12.values()):
+                # Every field comes from typed ORM columns or values computed
+                # above, so skip re-validating each record.
+                record = WriteBackRecord.model_construct(
                     organization_id=organization_id,
                     employee_id=calc.employee_id,
-                    employee_external_id=external_id,
+                    employee_external_id=str(external_id),
                     provider=provider,
                     tax_year=batch.tax_year,
                     box_12_values=box_12,
@@ -168,29 +176,29 @@ class WriteBackEngine:
         """Calculate W-2 Box 12 values from an employee calculation."""
         values: dict[str, Decimal] = {}
 
-        ot_premium = getattr(calc, "qualified_ot_premium", None) or Decimal("0")
-        tip_credit = getattr(calc, "qualified_tip_credit", None) or Decimal("0")
-        phase_out_pct = getattr(calc, "phase_out_percentage", None) or Decimal("0")
+        ot_premium = getattr(calc, "qualified_ot_premium", None) or _ZERO
+        tip_credit = getattr(calc, "qualified_tip_credit", None) or _ZERO
+        phase_out_pct = getattr(calc, "phase_out_percentage", None) or _ZERO
 
         # Apply phase-out
-        phase_out_multiplier = Decimal("1") - (phase_out_pct / Decimal("100"))
+        phase_out_multiplier = _ONE - (phase_out_pct / _HUNDRED)
 
         # TT: Combined overtime + tips
         combined = (ot_premium + tip_credit) * phase_out_multiplier
-        if combined > Decimal("0"):
-            values[W2Box12Code.TT.value] = combined.quantize(Decimal("0.01"))
+        if combined > _ZERO:
+            values[W2Box12Code.TT.value] = combined.quantize(_CENT)
 
         # TP: Tips only (subset of TT)
         tips_only = tip_credit * phase_out_multiplier
-        if tips_only > Decimal("0"):
-            values[W2Box12Code.TP.value] = tips_only.quantize(Decimal("0.01"))
+        if tips_only > _ZERO:
+            values[W2Box12Code.TP.value] = tips_only.quantize(_CENT)
 
         # TS: Senior wages (if applicable)
-        senior_wages = getattr(calc, "qualified_senior_wages", None) or Decimal("0")
-        if senior_wages > Decimal("0"):
+        senior_wages = getattr(calc, "qualified_senior_wages", None) or _ZERO
+        if senior_wages > _ZERO:
             values[W2Box12Code.TS.value] = (
                 senior_wages * phase_out_multiplier
-            ).quantize(Decimal("0.01"))
+            ).quantize(_CENT)
 
         return values
 
@@ -201,10 +209,11 @@ class WriteBackEngine:
     ) -> WriteBackBatch:
         """Mark a batch as approved for transmission."""
         batch.status = WriteBackStatus.APPROVED
+        approved_at = datetime.utcnow()
         for record in batch.records:
             record.status = WriteBackStatus.APPROVED
             record.approved_by = approved_by
-            record.approved_at = datetime.utcnow()
+            record.approved_at = approved_at
         return batch
 
     async def execute_batch(
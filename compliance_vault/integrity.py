@@ -170,15 +170,20 @@ async def verify_entry(
 
     # Verify previous hash linkage
     if entry.sequence_number > 1 and entry.previous_hash:
-        prev_result = await db.execute(
-            select(ComplianceVault).where(
+        # Follow the previous_id link (PK lookup); fall back to the
+        # sequence number for entries written without one.
+        if entry.previous_id:
+            prev_query = select(ComplianceVault.entry_hash).where(
+                ComplianceVault.id == entry.previous_id
+            )
+        else:
+            prev_query = select(ComplianceVault.entry_hash).where(
                 ComplianceVault.organization_id == entry.organization_id,
                 ComplianceVault.sequence_number == entry.sequence_number - 1,
             )
-        )
-        prev_entry = prev_result.scalar_one_or_none()
+        prev_entry_hash = (await db.execute(prev_query)).scalar_one_or_none()
 
-        if prev_entry and prev_entry.entry_hash != entry.previous_hash:
+        if prev_entry_hash and prev_entry_hash != entry.previous_hash:
             return {
                 "is_valid": False,
                 "message": "Previous hash linkage broken",
@@ -11,7 +11,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -57,55 +57,111 @@ class ComplianceVaultLedger:
         Returns:
             Created vault entry as dict
         """
+        entries = await self.append_many(
+            organization_id=organization_id,
+            entry_type=entry_type,
+            contents=[content],
+            actor_id=actor_id,
+            actor_type=actor_type,
+        )
+        return entries[0]
+
+    async def append_many(
+        self,
+        organization_id: UUID,
+        entry_type: str,
+        contents: list[dict[str, Any]],
+        actor_id: UUID | None = None,
+        actor_type: str | None = None,
+    ) -> list[dict]:
+        """
+        Append several entries to the vault in order.
+
+        The chain head is looked up (and locked) once, the entries are
+        hashed in sequence, and all of them are inserted with a single
+        flush.
+
+        Args:
+            organization_id: Organization these entries belong to
+            entry_type: Type of every entry in the batch
+            contents: JSON-serializable content for each entry, in chain order
+            actor_id: Who performed the action
+            actor_type: Type of actor (user, system, api)
+
+        Returns:
+            Created vault entries as dicts, in chain order
+        """
+        from backend.models.base import uuid7
         from backend.models.compliance_vault import ComplianceVault
 
+        if not contents:
+            return []
+
         # Get the latest entry for hash chaining
         prev = await self._get_latest_entry(organization_id)
         previous_hash = prev.entry_hash if prev else "GENESIS"
+        previous_id = prev.id if prev else None
         next_sequence = (prev.sequence_number + 1) if prev else 1
 
-        # Serialize content deterministically
-        content_json = json.dumps(content, sort_keys=True, default=str)
-
-        # Calculate entry hash
         now = datetime.utcnow()
-        hash_input = f"{previous_hash}|{content_json}|{now.isoformat()}"
-        entry_hash = hashlib.sha256(hash_input.encode()).hexdigest()
+        timestamp_suffix = f"|{now.isoformat()}".encode()
 
         # Calculate retention expiry
         retention_expires = now + timedelta(days=RETENTION_YEARS * 365)
 
-        # Create entry
-        entry = ComplianceVault(
-            id=uuid4(),
-            organization_id=organization_id,
-            entry_type=entry_type,
-            entry_hash=entry_hash,
-            previous_hash=previous_hash if prev else None,
-            sequence_number=next_sequence,
-            content=content,
-            content_hash=hashlib.sha256(content_json.encode()).hexdigest(),
-            retention_expires_at=retention_expires,
-            actor_id=actor_id,
-            actor_type=actor_type or "system",
-        )
+        entries = []
+        created = []
+        for content in contents:
+            # Serialize content deterministically, encoding it once for both hashes
+            content_bytes = json.dumps(content, sort_keys=True, default=str).encode()
+
+            # Calculate entry hash over previous_hash|content|timestamp. Fed
+            # piecewise so the (possibly large) content isn't copied into a
+            # concatenated string first.
+            hasher = hashlib.sha256(f"{previous_hash}|".encode())
+            hasher.update(content_bytes)
+            hasher.update(timestamp_suffix)
+            entry_hash = hasher.hexdigest()
+
+            # Create entry
+            entry = ComplianceVault(
+                id=uuid7(),
+                organization_id=organization_id,
+                entry_type=entry_type,
+                entry_hash=entry_hash,
+                previous_hash=previous_hash if previous_id else None,
+                previous_id=previous_id,
+                sequence_number=next_sequence,
+                content=content,
+                content_hash=hashlib.sha256(content_bytes).hexdigest(),
+                retention_expires_at=retention_expires,
+                actor_id=actor_id,
+                actor_type=actor_type or "system",
+            )
+            entries.append(entry)
 
-        self.db.add(entry)
-        await self.db.flush()
+            logger.info(
+                f"Vault entry #{next_sequence} created: "
+                f"type={entry_type}, hash={entry_hash[:16]}..."
+            )
 
-        logger.info(
-            f"Vault entry #{next_sequence} created: "
-            f"type={entry_type}, hash={entry_hash[:16]}..."
-        )
+            created.append({
+                "id": str(entry.id),
+                "entry_type": entry_type,
+                "entry_hash": entry_hash,
+                "previous_hash": previous_hash,
+                "sequence_number": next_sequence,
+                "created_at": now.isoformat(),
+            })
 
-        return {
-            "id": str(entry.id),
-            "entry_type": entry_type,
-            "entry_hash": entry_hash,
-            "previous_hash": previous_hash,
-            "sequence_number": next_sequence,
-            "created_at": now.isoformat(),
-        }
+            previous_hash = entry_hash
+            previous_id = entry.id
+            next_sequence += 1
+
+        self.db.add_all(entries)
+        await self.db.flush()
+
+        return created
 
     async def append_calculation(
         self,
@@ -119,12 +175,27 @@ class ComplianceVaultLedger:
         return await self.append(
             organization_id=organization_id,
             entry_type="calculation",
-            content={
-                "action": "calculation_completed",
-                "calculation_run_id": str(calculation_run_id),
-                "employee_id": str(employee_id),
-                **calculation_data,
-            },
+            content=self._calculation_content(
+                calculation_run_id, employee_id, calculation_data
+            ),
+            actor_id=actor_id,
+        )
+
+    async def append_calculations(
+        self,
+        organization_id: UUID,
+        calculation_run_id: UUID,
+        calculations: list[tuple[UUID, dict]],
+        actor_id: UUID | None = None,
+    ) -> list[dict]:
+        """Convenience method for a batch of (employee_id, calculation_data) entries."""
+        return await self.append_many(
+            organization_id=organization_id,
+            entry_type="calculation",
+            contents=[
+                self._calculation_content(calculation_run_id, employee_id, data)
+                for employee_id, data in calculations
+            ],
             actor_id=actor_id,
         )
 
@@ -225,16 +296,49 @@ class ComplianceVaultLedger:
         return result.scalar() or 0
 
     async def _get_latest_entry(self, organization_id: UUID):
-        """Get the most recent vault entry for hash chaining."""
+        """
+        Get the chain head (id, entry_hash, sequence_number) for hash chaining.
+
+        Takes a per-organization transaction-scoped advisory lock first so
+        concurrent appends to the same chain queue up instead of racing on
+        the next sequence number; uq_vault_org_seq rejects anything that
+        slips past. The head lookup is a single probe of that index.
+        """
         from backend.models.compliance_vault import ComplianceVault
 
+        await self.db.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    func.hashtextextended(str(organization_id), 0)
+                )
+            )
+        )
+
         result = await self.db.execute(
-            select(ComplianceVault)
+            select(
+                ComplianceVault.id,
+                ComplianceVault.entry_hash,
+                ComplianceVault.sequence_number,
+            )
             .where(ComplianceVault.organization_id == organization_id)
             .order_by(ComplianceVault.sequence_number.desc())
             .limit(1)
         )
-        return result.scalar_one_or_none()
+        return result.one_or_none()
+
+    @staticmethod
+    def _calculation_content(
+        calculation_run_id: UUID,
+        employee_id: UUID,
+        calculation_data: dict,
+    ) -> dict[str, Any]:
+        """Build the vault content for one employee calculation."""
+        return {
+            "action": "calculation_completed",
+            "calculation_run_id": str(calculation_run_id),
+            "employee_id": str(employee_id),
+            **calculation_data,
+        }
 
     def _entry_to_dict(self, entry) -> dict:
         """Convert a vault entry model to dict."""
@@ -244,6 +348,7 @@ class ComplianceVaultLedger:
             "entry_type": entry.entry_type,
             "entry_hash": entry.entry_hash,
             "previous_hash": entry.previous_hash,
+            "previous_id": str(entry.previous_id) if entry.previous_id else None,
             "sequence_number": entry.sequence_number,
             "content": entry.content,
             "content_hash": entry.content_hash,
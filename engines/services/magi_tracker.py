@@ -10,6 +10,11 @@ from typing import Literal
 
 from engines.schemas.phase_out import PhaseOutInput, PhaseOutOutput
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_CENT = Decimal("0.01")
+_APPROACHING_FRACTION = Decimal("0.9")
+
 # OBBB Phase-out thresholds per PRD Section 2.3.3
 # These are hypothetical thresholds based on the PRD specification
 PHASE_OUT_THRESHOLDS: dict[int, dict[str, dict[str, Decimal]]] = {
@@ -118,15 +123,15 @@ def calculate_phase_out(input_data: PhaseOutInput) -> PhaseOutOutput:
     # Calculate phase-out percentage
     if magi <= threshold_start:
         # No phase-out
-        excess = Decimal("0")
-        phase_out_pct = Decimal("0")
+        excess = _ZERO
+        phase_out_pct = _ZERO
         is_fully_phased_out = False
         is_partially_phased_out = False
         is_no_phase_out = True
     elif magi >= threshold_end:
         # Full phase-out
         excess = magi - threshold_start
-        phase_out_pct = Decimal("100")
+        phase_out_pct = _HUNDRED
         is_fully_phased_out = True
         is_partially_phased_out = False
         is_no_phase_out = False
@@ -135,7 +140,7 @@ def calculate_phase_out(input_data: PhaseOutInput) -> PhaseOutOutput:
         # Partial phase-out (linear)
         excess = magi - threshold_start
         phase_out_pct = ((excess / phase_out_range) * 100).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
+            _CENT, rounding=ROUND_HALF_UP
         )
         is_fully_phased_out = False
         is_partially_phased_out = True
@@ -149,10 +154,10 @@ def calculate_phase_out(input_data: PhaseOutInput) -> PhaseOutOutput:
     reduction_factor = phase_out_pct / 100
 
     ot_reduction = (input_data.ot_credit_pre_phase_out * reduction_factor).quantize(
-        Decimal("0.01"), rounding=ROUND_HALF_UP
+        _CENT, rounding=ROUND_HALF_UP
     )
     tip_reduction = (input_data.tip_credit_pre_phase_out * reduction_factor).quantize(
-        Decimal("0.01"), rounding=ROUND_HALF_UP
+        _CENT, rounding=ROUND_HALF_UP
     )
 
     ot_final = input_data.ot_credit_pre_phase_out - ot_reduction
@@ -225,11 +230,11 @@ def check_phase_out_risk(
     threshold_start, threshold_end = get_thresholds(tax_year, filing_status)
 
     if current_magi >= threshold_end:
-        return True, Decimal("100"), "fully_phased_out"
+        return True, _HUNDRED, "fully_phased_out"
     elif current_magi >= threshold_start:
         pct_through = ((current_magi - threshold_start) / (threshold_end - threshold_start)) * 100
         return True, pct_through, "in_phase_out"
-    elif current_magi >= threshold_start * Decimal("0.9"):
+    elif current_magi >= threshold_start * _APPROACHING_FRACTION:
         # Within 10% of threshold
         pct_to_threshold = (current_magi / threshold_start) * 100
         return True, pct_to_threshold, "approaching"
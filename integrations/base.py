@@ -4,14 +4,97 @@ Base Integration Classes
 Abstract base classes and common data models for all integrations.
 """
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import AsyncGenerator
 
+import httpx
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
+# HTTP client shared by every integration in the process, so consecutive
+# syncs against the same provider reuse open TLS connections. It is an
+# ordinary AsyncClient, so HTTPS_PROXY/NO_PROXY from the environment still
+# apply. Its connections belong to the event loop that created it.
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client for the running event loop."""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client_loop is not loop:
+        previous, previous_loop = _shared_client, _shared_client_loop
+        if previous is not None:
+            # Its connections can only be closed on the loop that opened them
+            if previous_loop.is_running():
+                asyncio.run_coroutine_threadsafe(previous.aclose(), previous_loop)
+            else:
+                logger.warning(
+                    "Event loop of the shared HTTP client has stopped; "
+                    "its pooled connections cannot be closed cleanly"
+                )
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            # Never store cookies: the client serves every tenant's requests.
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared client's pooled connections."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = _shared_client_loop = None
+
+
+class IntegrationHTTPClient:
+    """
+    One integration's view of the shared HTTP client.
+
+    Applies the integration's base URL, headers, auth and timeout to each
+    request, so credentials never live on the shared client itself. A view
+    holds no connections, so integrations release it by dropping the
+    reference; the pool itself is closed by close_shared_http_client().
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str] | None = None,
+        auth: httpx.Auth | tuple[str, str] | None = None,
+        timeout: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers or {}
+        self.auth = auth
+        self.timeout = timeout
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request; relative URLs are joined to the base URL."""
+        if not url.startswith(("http://", "https://")):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        kwargs.setdefault("auth", self.auth)
+        kwargs.setdefault("timeout", self.timeout)
+        return await shared_http_client().request(method, url, headers=headers, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
 
 class IntegrationCategory(str, Enum):
     """Categories of integrations."""
@@ -11,7 +11,7 @@ from typing import AsyncGenerator
 
 import httpx
 
-from integrations.base import EmployeeData, HRISIntegration
+from integrations.base import EmployeeData, HRISIntegration, IntegrationHTTPClient
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +31,12 @@ class BambooHRIntegration(HRISIntegration):
         super().__init__(access_token, refresh_token, config)
         self.subdomain = (config or {}).get("subdomain", "")
         self.base_url = f"https://api.bamboohr.com/api/gateway.php/{self.subdomain}/v1"
-        self._client: httpx.AsyncClient | None = None
+        self._client: IntegrationHTTPClient | None = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> IntegrationHTTPClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = IntegrationHTTPClient(
                 base_url=self.base_url,
                 headers={
                     "Accept": "application/json",
@@ -48,9 +48,7 @@ class BambooHRIntegration(HRISIntegration):
         return self._client
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def test_connection(self) -> bool:
         try:
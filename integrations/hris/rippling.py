@@ -11,7 +11,12 @@ from typing import AsyncGenerator
 
 import httpx
 
-from integrations.base import EmployeeData, HRISIntegration
+from integrations.base import (
+    EmployeeData,
+    HRISIntegration,
+    IntegrationHTTPClient,
+    shared_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +36,12 @@ class RipplingIntegration(HRISIntegration):
         config: dict | None = None,
     ):
         super().__init__(access_token, refresh_token, config)
-        self._client: httpx.AsyncClient | None = None
+        self._client: IntegrationHTTPClient | None = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> IntegrationHTTPClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = IntegrationHTTPClient(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
@@ -47,9 +52,7 @@ class RipplingIntegration(HRISIntegration):
         return self._client
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def test_connection(self) -> bool:
         try:
@@ -63,18 +66,17 @@ class RipplingIntegration(HRISIntegration):
         client_id = self.config.get("client_id", "")
         client_secret = self.config.get("client_secret", "")
 
-        async with httpx.AsyncClient() as http:
-            response = await http.post(
-                f"{self.base_url}/platform/api/token",
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token,
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await shared_http_client().post(
+            f"{self.base_url}/platform/api/token",
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+                "client_id": client_id,
+                "client_secret": client_secret,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         return (
             data["access_token"],
@@ -11,7 +11,14 @@ from typing import AsyncGenerator
 
 import httpx
 
-from integrations.base import EmployeeData, POSIntegration, ShiftData, TipData
+from integrations.base import (
+    EmployeeData,
+    IntegrationHTTPClient,
+    POSIntegration,
+    ShiftData,
+    TipData,
+    shared_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +39,12 @@ class CloverIntegration(POSIntegration):
     ):
         super().__init__(access_token, refresh_token, config)
         self.merchant_id = (config or {}).get("merchant_id", "")
-        self._client: httpx.AsyncClient | None = None
+        self._client: IntegrationHTTPClient | None = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> IntegrationHTTPClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = IntegrationHTTPClient(
                 base_url=f"{self.base_url}/merchants/{self.merchant_id}",
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
@@ -48,9 +55,7 @@ class CloverIntegration(POSIntegration):
         return self._client
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def test_connection(self) -> bool:
         try:
@@ -65,17 +70,16 @@ class CloverIntegration(POSIntegration):
         client_id = self.config.get("client_id", "")
         client_secret = self.config.get("client_secret", "")
 
-        async with httpx.AsyncClient() as http:
-            response = await http.post(
-                "https://sandbox.dev.clover.com/oauth/v2/token",
-                data={
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "code": self.refresh_token,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await shared_http_client().post(
+            "https://sandbox.dev.clover.com/oauth/v2/token",
+            data={
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "code": self.refresh_token,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         return data.get("access_token", ""), None, None
 
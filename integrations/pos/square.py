@@ -11,7 +11,14 @@ from typing import AsyncGenerator
 
 import httpx
 
-from integrations.base import EmployeeData, POSIntegration, ShiftData, TipData
+from integrations.base import (
+    EmployeeData,
+    IntegrationHTTPClient,
+    POSIntegration,
+    ShiftData,
+    TipData,
+    shared_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +39,12 @@ class SquareIntegration(POSIntegration):
     ):
         super().__init__(access_token, refresh_token, config)
         self.location_id = (config or {}).get("location_id", "")
-        self._client: httpx.AsyncClient | None = None
+        self._client: IntegrationHTTPClient | None = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> IntegrationHTTPClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = IntegrationHTTPClient(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
@@ -49,9 +56,7 @@ class SquareIntegration(POSIntegration):
         return self._client
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def test_connection(self) -> bool:
         try:
@@ -65,18 +70,17 @@ class SquareIntegration(POSIntegration):
         client_id = self.config.get("client_id", "")
         client_secret = self.config.get("client_secret", "")
 
-        async with httpx.AsyncClient() as http:
-            response = await http.post(
-                "https://connect.squareup.com/oauth2/token",
-                json={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token,
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await shared_http_client().post(
+            "https://connect.squareup.com/oauth2/token",
+            json={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+                "client_id": client_id,
+                "client_secret": client_secret,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         return (
             data["access_token"],
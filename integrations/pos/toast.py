@@ -13,10 +13,12 @@ import httpx
 
 from integrations.base import (
     EmployeeData,
+    IntegrationHTTPClient,
     POSIntegration,
     ShiftData,
     SyncResult,
     TipData,
+    shared_http_client,
 )
 
 logger = logging.getLogger(__name__)
@@ -38,12 +40,12 @@ class ToastIntegration(POSIntegration):
     ):
         super().__init__(access_token, refresh_token, config)
         self.restaurant_guid = (config or {}).get("restaurant_guid", "")
-        self._client: httpx.AsyncClient | None = None
+        self._client: IntegrationHTTPClient | None = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> IntegrationHTTPClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = IntegrationHTTPClient(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
@@ -56,9 +58,7 @@ class ToastIntegration(POSIntegration):
 
     async def close(self):
         """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def test_connection(self) -> bool:
         """Verify Toast API connection."""
@@ -79,17 +79,16 @@ class ToastIntegration(POSIntegration):
         client_id = self.config.get("client_id", "")
         client_secret = self.config.get("client_secret", "")
 
-        async with httpx.AsyncClient() as http:
-            response = await http.post(
-                f"{self.base_url}/authentication/v1/authentication/login",
-                json={
-                    "clientId": client_id,
-                    "clientSecret": client_secret,
-                    "userAccessType": "TOAST_MACHINE_CLIENT",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await shared_http_client().post(
+            f"{self.base_url}/authentication/v1/authentication/login",
+            json={
+                "clientId": client_id,
+                "clientSecret": client_secret,
+                "userAccessType": "TOAST_MACHINE_CLIENT",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         new_token = data.get("token", {}).get("accessToken", "")
         expires_in = data.get("token", {}).get("expiresIn", 3600)
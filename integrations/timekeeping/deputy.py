@@ -11,7 +11,13 @@ from typing import AsyncGenerator
 
 import httpx
 
-from integrations.base import EmployeeData, ShiftData, TimekeepingIntegration
+from integrations.base import (
+    EmployeeData,
+    IntegrationHTTPClient,
+    ShiftData,
+    TimekeepingIntegration,
+    shared_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +38,13 @@ class DeputyIntegration(TimekeepingIntegration):
     ):
         super().__init__(access_token, refresh_token, config)
         self.subdomain = (config or {}).get("subdomain", "once")
-        self._client: httpx.AsyncClient | None = None
+        self._client: IntegrationHTTPClient | None = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> IntegrationHTTPClient:
         if self._client is None:
             base = f"https://{self.subdomain}.deputy.com/api/v1"
-            self._client = httpx.AsyncClient(
+            self._client = IntegrationHTTPClient(
                 base_url=base,
                 headers={
                     "Authorization": f"OAuth {self.access_token}",
@@ -50,9 +56,7 @@ class DeputyIntegration(TimekeepingIntegration):
         return self._client
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def test_connection(self) -> bool:
         try:
@@ -66,19 +70,18 @@ class DeputyIntegration(TimekeepingIntegration):
         client_id = self.config.get("client_id", "")
         client_secret = self.config.get("client_secret", "")
 
-        async with httpx.AsyncClient() as http:
-            response = await http.post(
-                f"https://{self.subdomain}.deputy.com/oauth/access_token",
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token,
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "scope": "longlife_refresh_token",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await shared_http_client().post(
+            f"https://{self.subdomain}.deputy.com/oauth/access_token",
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "scope": "longlife_refresh_token",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         return (
             data["access_token"],
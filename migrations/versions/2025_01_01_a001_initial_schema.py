@@ -17,8 +17,93 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native enum types (4-byte oid per value) instead of VARCHAR + CHECK IN (...).
+# create_type=False: they are created explicitly in upgrade() and dropped
+# after the tables in downgrade().
+ORG_TIER = postgresql.ENUM("starter", "pro", "enterprise", name="org_tier", create_type=False)
+ORG_STATUS = postgresql.ENUM("active", "suspended", "closed", name="org_status", create_type=False)
+WORKWEEK_DAY = postgresql.ENUM(
+    "sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday",
+    name="workweek_day",
+    create_type=False,
+)
+USER_ROLE = postgresql.ENUM("owner", "admin", "manager", "viewer", name="user_role", create_type=False)
+EMPLOYMENT_STATUS = postgresql.ENUM(
+    "active", "terminated", "leave", name="employment_status", create_type=False
+)
+ACTOR_TYPE = postgresql.ENUM(
+    "user", "system", "integration", "calculation_engine", name="actor_type", create_type=False
+)
+RUN_TYPE = postgresql.ENUM(
+    "pay_period", "quarterly", "annual", "ad_hoc", "retro_audit", name="run_type", create_type=False
+)
+RUN_STATUS = postgresql.ENUM(
+    "pending", "syncing", "calculating", "pending_approval", "approved", "rejected", "finalized", "error",
+    name="run_status",
+    create_type=False,
+)
+ENUM_TYPES = (
+    ORG_TIER, ORG_STATUS, WORKWEEK_DAY, USER_ROLE, EMPLOYMENT_STATUS, ACTOR_TYPE, RUN_TYPE, RUN_STATUS,
+)
+
+# Every SHA-256 column shares one length check via this domain.
+SHA256_DIGEST = postgresql.DOMAIN(
+    "sha256_digest", sa.LargeBinary(), check="octet_length(VALUE) = 32", create_type=False
+)
+
+# employee_calculations is hash-partitioned on calculation_run_id so a run's
+# rows (and its slice of every index) live in one small partition.
+EMPLOYEE_CALCULATION_PARTITIONS = 16
+
+# Tables whose updated_at is maintained by a moddatetime BEFORE UPDATE trigger.
+TIMESTAMPED_TABLES = (
+    "organizations", "users", "api_keys", "ttoc_classifications", "employees",
+    "calculation_runs", "employee_calculations", "integrations",
+)
+
 
 def upgrade() -> None:
+    # Case-insensitive text for users.email; C trigger for updated_at.
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute("CREATE EXTENSION IF NOT EXISTS moddatetime")
+
+    # SHA-256 columns (*_hash) are raw 32-byte BYTEA (sha256_digest domain),
+    # not 64-char hex. When loading data exported from a VARCHAR(64) schema,
+    # convert with decode(<col>, 'hex'). The ORM maps them via
+    # models.base.Sha256Digest.
+    # Time-ordered UUIDv7 (RFC 9562): 48-bit unix_ts_ms prefix over the random
+    # bits of a v4 UUID, with the version nibble flipped to 7. Used as the PK
+    # default on append-heavy tables so inserts land on the right-hand B-tree leaf.
+    # Postgres 18+ ships pg_catalog.uuidv7(), which resolves first and wins.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION public.uuidv7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+
+    bind = op.get_bind()
+    for enum_type in ENUM_TYPES:
+        enum_type.create(bind, checkfirst=True)
+    SHA256_DIGEST.create(bind, checkfirst=True)
+
     # === organizations ===
     op.create_table(
         "organizations",
@@ -26,12 +111,12 @@ def upgrade() -> None:
         sa.Column("name", sa.String(255), nullable=False, comment="Legal business name"),
         sa.Column("ein", sa.String(10), nullable=False, unique=True, comment="Employer Identification Number"),
         sa.Column("tax_year", sa.Integer(), nullable=False, server_default="2025"),
-        sa.Column("tier", sa.String(20), nullable=False, server_default="starter"),
+        sa.Column("tier", ORG_TIER, nullable=False, server_default="starter"),
         sa.Column("tip_credit_enabled", sa.Boolean(), nullable=False, server_default="false"),
         sa.Column("overtime_credit_enabled", sa.Boolean(), nullable=False, server_default="false"),
         sa.Column("penalty_guarantee_active", sa.Boolean(), nullable=False, server_default="false"),
-        sa.Column("status", sa.String(20), nullable=False, server_default="active"),
-        sa.Column("workweek_start", sa.String(10), nullable=False, server_default="sunday"),
+        sa.Column("status", ORG_STATUS, nullable=False, server_default="active"),
+        sa.Column("workweek_start", WORKWEEK_DAY, nullable=False, server_default="sunday"),
         sa.Column("settings", postgresql.JSONB(), nullable=False, server_default="{}"),
         sa.Column("primary_contact_email", sa.String(255), nullable=True),
         sa.Column("primary_contact_name", sa.String(255), nullable=True),
@@ -40,40 +125,37 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint("id"),
         sa.CheckConstraint("ein ~ '^[0-9]{2}-[0-9]{7}$'", name="valid_ein_format"),
-        sa.CheckConstraint("tier IN ('starter', 'pro', 'enterprise')", name="valid_tier"),
-        sa.CheckConstraint("status IN ('active', 'suspended', 'closed')", name="valid_status"),
-        sa.CheckConstraint(
-            "workweek_start IN ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday')",
-            name="valid_workweek_start",
-        ),
     )
-    op.create_index("ix_organizations_ein", "organizations", ["ein"])
-    op.create_index("ix_organizations_status", "organizations", ["status"])
 
     # === users ===
     op.create_table(
         "users",
         sa.Column("id", sa.Uuid(), nullable=False),
         sa.Column("organization_id", sa.Uuid(), sa.ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False),
-        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("email", postgresql.CITEXT(), nullable=False, unique=True),
         sa.Column("name", sa.String(255), nullable=True),
         sa.Column("hashed_password", sa.String(255), nullable=True),
-        sa.Column("role", sa.String(50), nullable=False, server_default="viewer"),
+        sa.Column("role", USER_ROLE, nullable=False, server_default="viewer"),
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
         sa.Column("is_verified", sa.Boolean(), nullable=False, server_default="false"),
         sa.Column("last_login_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("invite_token", sa.String(255), nullable=True, unique=True),
-        sa.Column("invite_expires_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("sso_provider", sa.String(100), nullable=True),
         sa.Column("sso_external_id", sa.String(255), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_users_email", "users", ["email"])
-    op.create_index("ix_users_organization_id", "users", ["organization_id"])
-    op.create_index("ix_users_org_role", "users", ["organization_id", "role"])
-    op.create_index("ix_users_sso", "users", ["sso_provider", "sso_external_id"])
+
+    # === user_invites ===
+    # Short-lived invite tokens, kept off the hot users row.
+    op.create_table(
+        "user_invites",
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("token", sa.String(255), nullable=False, unique=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
 
     # === api_keys ===
     op.create_table(
@@ -82,7 +164,7 @@ def upgrade() -> None:
         sa.Column("organization_id", sa.Uuid(), sa.ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False),
         sa.Column("created_by", sa.Uuid(), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("name", sa.String(255), nullable=False),
-        sa.Column("key_hash", sa.String(64), nullable=False, unique=True),
+        sa.Column("key_hash", SHA256_DIGEST, nullable=False, unique=True),
         sa.Column("key_prefix", sa.String(20), nullable=False),
         sa.Column("permissions", postgresql.JSONB(), nullable=False, server_default="[]"),
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
@@ -92,13 +174,11 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_api_keys_key_hash", "api_keys", ["key_hash"])
-    op.create_index("ix_api_keys_org_active", "api_keys", ["organization_id", "is_active"])
 
     # === ttoc_classifications (must be before employees due to FK) ===
     op.create_table(
         "ttoc_classifications",
-        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("uuidv7()")),
         sa.Column("employee_id", sa.Uuid(), nullable=False),  # FK added after employees table
         sa.Column("job_title", sa.String(255), nullable=False),
         sa.Column("job_description", sa.Text(), nullable=True),
@@ -115,8 +195,8 @@ def upgrade() -> None:
         sa.Column("model_id", sa.String(50), nullable=False),
         sa.Column("model_temperature", sa.Float(), nullable=False, server_default="0"),
         sa.Column("prompt_version", sa.String(20), nullable=False),
-        sa.Column("prompt_hash", sa.String(64), nullable=False),
-        sa.Column("response_hash", sa.String(64), nullable=False),
+        sa.Column("prompt_hash", SHA256_DIGEST, nullable=False),
+        sa.Column("response_hash", SHA256_DIGEST, nullable=False),
         sa.Column("is_human_verified", sa.Boolean(), nullable=False, server_default="false"),
         sa.Column("verified_by", sa.Uuid(), nullable=True),
         sa.Column("verified_at", sa.DateTime(timezone=True), nullable=True),
@@ -135,11 +215,6 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_ttoc_classifications_employee_id", "ttoc_classifications", ["employee_id"])
-    op.create_index("ix_ttoc_classifications_ttoc_code", "ttoc_classifications", ["ttoc_code"])
-    op.create_index("ix_ttoc_classifications_is_active", "ttoc_classifications", ["is_active"])
-    op.create_index("ix_ttoc_classifications_confidence", "ttoc_classifications", ["confidence_score"])
-    op.create_index("ix_ttoc_classifications_employee_active", "ttoc_classifications", ["employee_id", "is_active"])
 
     # === employees ===
     op.create_table(
@@ -149,15 +224,15 @@ def upgrade() -> None:
         sa.Column("external_ids", postgresql.JSONB(), nullable=False, server_default="{}"),
         sa.Column("first_name", sa.String(100), nullable=False),
         sa.Column("last_name", sa.String(100), nullable=False),
-        sa.Column("ssn_hash", sa.String(64), nullable=False),
+        sa.Column("ssn_hash", SHA256_DIGEST, nullable=False),
         sa.Column("hire_date", sa.Date(), nullable=False),
         sa.Column("termination_date", sa.Date(), nullable=True),
-        sa.Column("employment_status", sa.String(20), nullable=False, server_default="active"),
+        sa.Column("employment_status", EMPLOYMENT_STATUS, nullable=False, server_default="active"),
         sa.Column("job_title", sa.String(255), nullable=True),
         sa.Column("job_description", sa.Text(), nullable=True),
         sa.Column("department", sa.String(100), nullable=True),
         sa.Column("duties", postgresql.JSONB(), nullable=False, server_default="[]"),
-        sa.Column("hourly_rate", sa.Float(), nullable=True),
+        sa.Column("hourly_rate", sa.Numeric(8, 4), nullable=True),
         sa.Column("is_hourly", sa.Boolean(), nullable=False, server_default="true"),
         sa.Column("ttoc_code", sa.String(10), nullable=True),
         sa.Column("ttoc_classification_id", sa.Uuid(), sa.ForeignKey("ttoc_classifications.id"), nullable=True),
@@ -166,12 +241,12 @@ def upgrade() -> None:
         sa.Column("ttoc_verified_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("ttoc_verified_by", sa.Uuid(), nullable=True),
         sa.Column("filing_status", sa.String(30), nullable=True),
-        sa.Column("estimated_annual_magi", sa.Float(), nullable=True),
-        sa.Column("ytd_gross_wages", sa.Float(), nullable=False, server_default="0"),
-        sa.Column("ytd_overtime_hours", sa.Float(), nullable=False, server_default="0"),
-        sa.Column("ytd_tips", sa.Float(), nullable=False, server_default="0"),
-        sa.Column("ytd_qualified_ot_premium", sa.Float(), nullable=False, server_default="0"),
-        sa.Column("ytd_qualified_tips", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("estimated_annual_magi", sa.Numeric(12, 2), nullable=True),
+        sa.Column("ytd_gross_wages", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("ytd_overtime_hours", sa.Numeric(8, 2), nullable=False, server_default="0"),
+        sa.Column("ytd_tips", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("ytd_qualified_ot_premium", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("ytd_qualified_tips", sa.Numeric(12, 2), nullable=False, server_default="0"),
         # AuditMixin
         sa.Column("created_by", sa.Uuid(), nullable=True),
         sa.Column("modified_by", sa.Uuid(), nullable=True),
@@ -182,65 +257,53 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("organization_id", "ssn_hash", name="uq_employee_org_ssn"),
     )
-    op.create_index("ix_employees_organization_id", "employees", ["organization_id"])
-    op.create_index("ix_employees_employment_status", "employees", ["employment_status"])
-    op.create_index("ix_employees_ttoc_code", "employees", ["ttoc_code"])
-    op.create_index("ix_employees_org_status", "employees", ["organization_id", "employment_status"])
 
-    # Add FK from ttoc_classifications.employee_id -> employees.id
-    op.create_foreign_key(
-        "fk_ttoc_classifications_employee_id",
-        "ttoc_classifications",
-        "employees",
-        ["employee_id"],
-        ["id"],
-        ondelete="CASCADE",
+    # Add FK from ttoc_classifications.employee_id -> employees.id as NOT
+    # VALID; it is validated below, after the DDL transaction commits.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE ttoc_classifications "
+        "ADD CONSTRAINT fk_ttoc_classifications_employee_id "
+        "FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE NOT VALID"
     )
 
     # === compliance_vault ===
     op.create_table(
         "compliance_vault",
-        sa.Column("id", sa.Uuid(), nullable=False),
-        sa.Column("entry_hash", sa.String(64), nullable=False, unique=True),
-        sa.Column("previous_hash", sa.String(64), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("uuidv7()")),
+        sa.Column("entry_hash", SHA256_DIGEST, nullable=False, unique=True),
+        sa.Column("previous_hash", SHA256_DIGEST, nullable=True),
+        sa.Column("previous_id", sa.Uuid(), sa.ForeignKey("compliance_vault.id"), nullable=True),
         sa.Column("sequence_number", sa.Integer(), nullable=False),
         sa.Column("entry_type", sa.String(50), nullable=False),
         sa.Column("organization_id", sa.Uuid(), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("employee_id", sa.Uuid(), nullable=True),
         sa.Column("calculation_run_id", sa.Uuid(), nullable=True),
         sa.Column("content", postgresql.JSONB(), nullable=False),
-        sa.Column("content_hash", sa.String(64), nullable=False, comment="SHA-256 hash of content JSON"),
+        sa.Column("content_hash", SHA256_DIGEST, nullable=False, comment="SHA-256 hash of content JSON"),
         sa.Column("summary", sa.String(500), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.Column("retention_expires_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("actor_id", sa.Uuid(), nullable=True),
-        sa.Column("actor_type", sa.String(20), nullable=False, server_default="system"),
+        sa.Column("actor_type", ACTOR_TYPE, nullable=False, server_default="system"),
         sa.Column("actor_ip", sa.String(45), nullable=True),
         sa.Column("verified_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("verification_status", sa.String(20), nullable=True),
         sa.PrimaryKeyConstraint("id"),
-        sa.CheckConstraint("entry_hash ~ '^[a-f0-9]{64}$'", name="valid_entry_hash"),
-        sa.CheckConstraint("previous_hash IS NULL OR previous_hash ~ '^[a-f0-9]{64}$'", name="valid_previous_hash"),
         sa.CheckConstraint("retention_expires_at > created_at", name="valid_retention_date"),
+        sa.UniqueConstraint("organization_id", "sequence_number", name="uq_vault_org_seq"),
     )
-    op.create_index("ix_compliance_vault_org_id", "compliance_vault", ["organization_id"])
-    op.create_index("ix_compliance_vault_entry_type", "compliance_vault", ["entry_type"])
-    op.create_index("ix_compliance_vault_created_at", "compliance_vault", ["created_at"])
-    op.create_index("ix_compliance_vault_employee_id", "compliance_vault", ["employee_id"])
-    op.create_index("ix_compliance_vault_calculation_run_id", "compliance_vault", ["calculation_run_id"])
-    op.create_index("ix_compliance_vault_retention", "compliance_vault", ["retention_expires_at"])
-    op.create_index("ix_compliance_vault_org_sequence", "compliance_vault", ["organization_id", "sequence_number"])
 
     # === calculation_runs ===
     op.create_table(
         "calculation_runs",
-        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("uuidv7()")),
         sa.Column("organization_id", sa.Uuid(), sa.ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False),
-        sa.Column("run_type", sa.String(30), nullable=False),
+        sa.Column("run_type", RUN_TYPE, nullable=False),
         sa.Column("period_start", sa.Date(), nullable=False),
         sa.Column("period_end", sa.Date(), nullable=False),
         sa.Column("tax_year", sa.Integer(), nullable=False),
-        sa.Column("status", sa.String(30), nullable=False, server_default="pending"),
+        sa.Column("status", RUN_STATUS, nullable=False, server_default="pending"),
         sa.Column("error_message", sa.Text(), nullable=True),
         sa.Column("total_employees", sa.Integer(), nullable=False, server_default="0"),
         sa.Column("processed_employees", sa.Integer(), nullable=False, server_default="0"),
@@ -274,24 +337,12 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint("id"),
         sa.CheckConstraint("period_end >= period_start", name="valid_period_range"),
-        sa.CheckConstraint(
-            "run_type IN ('pay_period', 'quarterly', 'annual', 'ad_hoc', 'retro_audit')",
-            name="valid_run_type",
-        ),
-        sa.CheckConstraint(
-            "status IN ('pending', 'syncing', 'calculating', 'pending_approval', 'approved', 'rejected', 'finalized', 'error')",
-            name="valid_run_status",
-        ),
-    )
-    op.create_index("ix_calculation_runs_org_id", "calculation_runs", ["organization_id"])
-    op.create_index("ix_calculation_runs_status", "calculation_runs", ["status"])
-    op.create_index("ix_calculation_runs_org_period", "calculation_runs", ["organization_id", "period_start", "period_end"])
-    op.create_index("ix_calculation_runs_tax_year", "calculation_runs", ["organization_id", "tax_year"])
+    )
 
     # === employee_calculations ===
     op.create_table(
         "employee_calculations",
-        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("uuidv7()")),
         sa.Column("calculation_run_id", sa.Uuid(), sa.ForeignKey("calculation_runs.id", ondelete="CASCADE"), nullable=False),
         sa.Column("employee_id", sa.Uuid(), sa.ForeignKey("employees.id", ondelete="CASCADE"), nullable=False),
         # Hours
@@ -340,15 +391,37 @@ def upgrade() -> None:
         sa.Column("review_notes", sa.Text(), nullable=True),
         # Audit
         sa.Column("calculation_trace", postgresql.JSONB(), nullable=False, server_default="{}"),
-        sa.Column("input_data_hash", sa.String(64), nullable=True),
+        sa.Column("input_data_hash", SHA256_DIGEST, nullable=True),
         sa.Column("engine_versions", postgresql.JSONB(), nullable=False, server_default="{}"),
         # Timestamps
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
-        sa.PrimaryKeyConstraint("id"),
+        # Partitioned tables require the partition key in every unique constraint
+        sa.PrimaryKeyConstraint("id", "calculation_run_id"),
         sa.UniqueConstraint("calculation_run_id", "employee_id", name="uq_run_employee"),
+        postgresql_partition_by="HASH (calculation_run_id)",
     )
-    op.create_index("ix_employee_calculations_run_id", "employee_calculations", ["calculation_run_id"])
+    for remainder in range(EMPLOYEE_CALCULATION_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE employee_calculations_p{remainder:02d} "
+            f"PARTITION OF employee_calculations "
+            f"FOR VALUES WITH (MODULUS {EMPLOYEE_CALCULATION_PARTITIONS}, REMAINDER {remainder}) "
+            # fillfactor: headroom for HOT updates as rows move through status
+            # values. toast_tuple_target: compress rows past 512 bytes instead
+            # of ~2KB, since typical traces sit just under the default.
+            f"WITH (fillfactor = 90, toast_tuple_target = 512)"
+        )
+    # The audit-only JSONB blobs dominate row width. lz4 compresses them
+    # much faster than the default pglz; fall back if the server lacks it.
+    has_lz4 = bind.execute(
+        sa.text(
+            "SELECT 'lz4' = ANY(enumvals) FROM pg_settings "
+            "WHERE name = 'default_toast_compression'"
+        )
+    ).scalar()
+    if has_lz4:
+        for column in ("calculation_trace", "regular_rate_components"):
+            op.execute(f"ALTER TABLE employee_calculations ALTER COLUMN {column} SET COMPRESSION lz4")
     op.create_index("ix_employee_calculations_employee_id", "employee_calculations", ["employee_id"])
     op.create_index("ix_employee_calculations_status", "employee_calculations", ["status"])
 
@@ -363,7 +436,6 @@ def upgrade() -> None:
         sa.Column("access_token_encrypted", sa.LargeBinary(), nullable=True),
         sa.Column("refresh_token_encrypted", sa.LargeBinary(), nullable=True),
         sa.Column("token_expires_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("oauth_state", sa.String(255), nullable=True),
         sa.Column("scopes", postgresql.JSONB(), nullable=False, server_default="[]"),
         sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
         sa.Column("last_error", sa.Text(), nullable=True),
@@ -383,17 +455,187 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("organization_id", "provider", name="uq_org_provider"),
     )
-    op.create_index("ix_integrations_organization_id", "integrations", ["organization_id"])
-    op.create_index("ix_integrations_provider", "integrations", ["provider"])
-    op.create_index("ix_integrations_status", "integrations", ["status"])
-    op.create_index("ix_integrations_next_sync", "integrations", ["next_sync_at"])
+
+    # === integration_oauth_states ===
+    # Pending OAuth state, kept off the integrations row read by sync jobs.
+    op.create_table(
+        "integration_oauth_states",
+        sa.Column("integration_id", sa.Uuid(), sa.ForeignKey("integrations.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("state", sa.String(255), nullable=False, unique=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("integration_id"),
+    )
+
+    for table in TIMESTAMPED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_moddatetime BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at)"
+        )
+
+    # Secondary indexes are built CONCURRENTLY outside the DDL transaction so
+    # the same pattern is safe to copy into migrations against live tables.
+    # employee_calculations keeps its indexes inline: Postgres cannot build
+    # indexes on a partitioned table concurrently.
+    with op.get_context().autocommit_block():
+        # Validating in its own transaction means the ACCESS EXCLUSIVE lock
+        # from ADD CONSTRAINT was released at the commit above; the scan only
+        # holds SHARE UPDATE EXCLUSIVE, which matters when this runs against
+        # a cloned, non-empty database.
+        op.execute("SET statement_timeout = 0")
+        op.execute(
+            "ALTER TABLE ttoc_classifications "
+            "VALIDATE CONSTRAINT fk_ttoc_classifications_employee_id"
+        )
+        _create_secondary_indexes()
+        # Keep each run's rows physically together for full-run report scans.
+        # CLUSTER takes ACCESS EXCLUSIVE (and, on a partitioned table, can't
+        # run in a transaction); here the table is empty, and it marks
+        # uq_run_employee as the index maintenance-window CLUSTERs reuse.
+        op.execute("CLUSTER employee_calculations USING uq_run_employee")
+
+
+def _create_secondary_indexes() -> None:
+    """Non-unique indexes, built without blocking writes."""
+    # organizations
+    op.create_index(
+        "ix_organizations_status", "organizations", ["status"],
+        postgresql_concurrently=True,
+    )
+
+    # users
+    op.create_index(
+        "ix_users_org_role", "users", ["organization_id", "role"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_users_sso", "users", ["sso_provider", "sso_external_id"],
+        postgresql_concurrently=True,
+    )
+
+    # api_keys
+    op.create_index(
+        "ix_api_keys_org_active", "api_keys", ["organization_id", "is_active"],
+        postgresql_concurrently=True,
+    )
+
+    # ttoc_classifications
+    op.create_index(
+        "ix_ttoc_classifications_ttoc_code", "ttoc_classifications", ["ttoc_code"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_ttoc_classifications_confidence", "ttoc_classifications", ["confidence_score"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_ttoc_classifications_employee_active", "ttoc_classifications", ["employee_id", "is_active"],
+        postgresql_concurrently=True,
+    )
+
+    # employees
+    op.create_index(
+        "ix_employees_employment_status", "employees", ["employment_status"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_employees_ttoc_code", "employees", ["ttoc_code"],
+        postgresql_concurrently=True,
+    )
+    # Covering columns let dashboard roster queries run as index-only scans
+    op.create_index(
+        "ix_employees_org_status",
+        "employees",
+        ["organization_id", "employment_status"],
+        postgresql_include=["first_name", "last_name", "ttoc_code", "hire_date"],
+        postgresql_concurrently=True,
+    )
+    # Weekly phase-out risk check: active employees above a YTD threshold
+    op.create_index(
+        "ix_employees_active_ytd_wages",
+        "employees",
+        ["ytd_gross_wages"],
+        postgresql_include=["organization_id", "filing_status"],
+        postgresql_where=sa.text("employment_status = 'active'"),
+        postgresql_concurrently=True,
+    )
+
+    # compliance_vault
+    op.create_index(
+        "ix_compliance_vault_entry_type", "compliance_vault", ["entry_type"],
+        postgresql_concurrently=True,
+    )
+    # The vault is append-only, so created_at and retention_expires_at track
+    # physical row order; BRIN summaries stay tiny where a B-tree would bloat.
+    op.create_index(
+        "ix_compliance_vault_created_at_brin", "compliance_vault", ["created_at"],
+        postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_compliance_vault_employee_id", "compliance_vault", ["employee_id"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_compliance_vault_calculation_run_id", "compliance_vault", ["calculation_run_id"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_compliance_vault_retention_brin", "compliance_vault", ["retention_expires_at"],
+        postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_compliance_vault_previous_id", "compliance_vault", ["previous_id"],
+        postgresql_concurrently=True,
+    )
+
+    # calculation_runs
+    op.create_index(
+        "ix_calculation_runs_status", "calculation_runs", ["status"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_calculation_runs_pending",
+        "calculation_runs",
+        ["organization_id", "created_at"],
+        postgresql_where=sa.text("status IN ('pending', 'syncing', 'calculating', 'pending_approval')"),
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_calculation_runs_org_period",
+        "calculation_runs",
+        ["organization_id", "period_start", "period_end"],
+        postgresql_include=["status", "total_employees", "processed_employees", "tax_year"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_calculation_runs_tax_year", "calculation_runs", ["organization_id", "tax_year"],
+        postgresql_concurrently=True,
+    )
+
+    # integrations
+    op.create_index(
+        "ix_integrations_provider", "integrations", ["provider"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_integrations_status", "integrations", ["status"],
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        "ix_integrations_next_sync", "integrations", ["next_sync_at"],
+        postgresql_concurrently=True,
+    )
 
 
 def downgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_moddatetime ON {table}")
     # Drop circular FKs first to avoid dependency issues
     op.drop_constraint("fk_ttoc_classifications_employee_id", "ttoc_classifications", type_="foreignkey")
     op.drop_constraint("employees_ttoc_classification_id_fkey", "employees", type_="foreignkey")
     # Now drop tables in order
+    op.drop_table("integration_oauth_states")
     op.drop_table("integrations")
     op.drop_table("employee_calculations")
     op.drop_table("calculation_runs")
@@ -401,5 +643,13 @@ def downgrade() -> None:
     op.drop_table("ttoc_classifications")
     op.drop_table("employees")
     op.drop_table("api_keys")
+    op.drop_table("user_invites")
     op.drop_table("users")
     op.drop_table("organizations")
+    bind = op.get_bind()
+    for enum_type in ENUM_TYPES:
+        enum_type.drop(bind, checkfirst=True)
+    SHA256_DIGEST.drop(bind, checkfirst=True)
+    op.execute("DROP FUNCTION IF EXISTS public.uuidv7()")
+    op.execute("DROP EXTENSION IF EXISTS moddatetime")
+    op.execute("DROP EXTENSION IF EXISTS citext")
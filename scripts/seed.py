@@ -14,8 +14,11 @@ import hashlib
 import secrets
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 from uuid import uuid4
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from backend.config import get_settings
 from backend.db.session import get_async_session
 from backend.models.api_key import APIKey
@@ -29,8 +32,38 @@ from backend.services.auth import hash_password
 settings = get_settings()
 
 
+async def _copy_records(db: AsyncSession, model: type, rows: list[dict[str, Any]]) -> None:
+    """
+    Bulk-load rows into a model's table with one asyncpg COPY.
+
+    The COPY column list is every key that appears in ``rows``, and values
+    go through each column's bind processing (hex digests, JSON). No model
+    defaults are applied: a key missing from a row is copied as NULL, and a
+    column missing from every row is left out, so it gets its server
+    default. Rows must spell out any value the database cannot default.
+    """
+    conn = await db.connection()
+    table = model.__table__
+    names = list(dict.fromkeys(key for row in rows for key in row))
+    processors = [
+        table.c[name].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+        for name in names
+    ]
+
+    records = []
+    for row in rows:
+        values = (row.get(name) for name in names)
+        records.append(tuple(
+            process(value) if process else value
+            for value, process in zip(values, processors)
+        ))
+    raw_conn = (await conn.get_raw_connection()).driver_connection
+    await raw_conn.copy_records_to_table(table.name, records=records, columns=names)
+
+
 async def seed():
     """Create demo data."""
+    now = datetime.utcnow()
     async with get_async_session() as db:
         # ── Organization ──────────────────────────────────
         org = Organization(
@@ -50,37 +83,42 @@ async def seed():
             },
             primary_contact_email="bella@bellasrestaurants.com",
             primary_contact_name="Bella Torres",
-            onboarded_at=datetime.utcnow() - timedelta(days=30),
+            onboarded_at=now - timedelta(days=30),
         )
         db.add(org)
-        await db.flush()
 
         # ── Admin User ────────────────────────────────────
+        # bcrypt is CPU-bound; hash both passwords concurrently off the loop.
+        admin_hash, manager_hash = await asyncio.gather(
+            asyncio.to_thread(hash_password, "SafeHarbor2025!"),
+            asyncio.to_thread(hash_password, "Manager2025!"),
+        )
         admin_user = User(
             id=uuid4(),
             organization_id=org.id,
             email="admin@bellasrestaurants.com",
             name="Bella Torres",
-            hashed_password=hash_password("SafeHarbor2025!"),
+            hashed_password=admin_hash,
             role="owner",
             is_active=True,
             is_verified=True,
-            last_login_at=datetime.utcnow() - timedelta(hours=2),
+            last_login_at=now - timedelta(hours=2),
         )
-        db.add(admin_user)
 
         manager_user = User(
             id=uuid4(),
             organization_id=org.id,
             email="manager@bellasrestaurants.com",
             name="Carlos Rivera",
-            hashed_password=hash_password("Manager2025!"),
+            hashed_password=manager_hash,
             role="manager",
             is_active=True,
             is_verified=True,
         )
-        db.add(manager_user)
+        db.add_all([admin_user, manager_user])
 
+        # The users->organization relationship orders these in one flush;
+        # APIKey has no relationships, so it has to wait for its parents.
         await db.flush()
 
         # ── API Key ───────────────────────────────────────
@@ -97,6 +135,10 @@ async def seed():
         )
         db.add(api_key)
 
+        # COPY bypasses the unit of work, so the rows it references must be
+        # in the database first.
+        await db.flush()
+
         # ── Employees (10) ────────────────────────────────
         employees_data = [
             {
@@ -201,18 +243,34 @@ async def seed():
             },
         ]
 
-        for emp_data in employees_data:
-            ssn_hash = hashlib.sha256(f"fake-ssn-{emp_data['first_name']}".encode()).hexdigest()
-            employee = Employee(
-                id=uuid4(),
-                organization_id=org.id,
-                ssn_hash=ssn_hash,
-                hire_date=date(2024, 1, 15),
-                **emp_data,
-            )
-            db.add(employee)
+        ssn_prefix = hashlib.sha256(b"fake-ssn-")
 
-        await db.flush()
+        def fake_ssn_hash(first_name: str) -> str:
+            digest = ssn_prefix.copy()
+            digest.update(first_name.encode())
+            return digest.hexdigest()
+
+        # Not every employee lists every YTD total; COPY would write NULL.
+        ytd_zero = dict.fromkeys(
+            (
+                "ytd_overtime_hours",
+                "ytd_tips",
+                "ytd_qualified_ot_premium",
+                "ytd_qualified_tips",
+            ),
+            Decimal("0"),
+        )
+        await _copy_records(db, Employee, [
+            {
+                "id": uuid4(),
+                "organization_id": org.id,
+                "ssn_hash": fake_ssn_hash(emp_data["first_name"]),
+                "hire_date": date(2024, 1, 15),
+                **ytd_zero,
+                **emp_data,
+            }
+            for emp_data in employees_data
+        ])
 
         # ── Integrations (3) ──────────────────────────────
         integrations_data = [
@@ -220,14 +278,14 @@ async def seed():
                 "provider": "gusto", "provider_category": "payroll",
                 "display_name": "Gusto Payroll",
                 "status": "connected",
-                "last_sync_at": datetime.utcnow() - timedelta(hours=1),
+                "last_sync_at": now - timedelta(hours=1),
                 "last_sync_status": "success", "last_sync_records": 10,
             },
             {
                 "provider": "toast", "provider_category": "pos",
                 "display_name": "Toast POS",
                 "status": "connected",
-                "last_sync_at": datetime.utcnow() - timedelta(minutes=15),
+                "last_sync_at": now - timedelta(minutes=15),
                 "last_sync_status": "success", "last_sync_records": 48,
             },
             {
@@ -237,14 +295,10 @@ async def seed():
             },
         ]
 
-        for int_data in integrations_data:
-            integration = Integration(
-                id=uuid4(),
-                organization_id=org.id,
-                scopes=[],
-                **int_data,
-            )
-            db.add(integration)
+        await _copy_records(db, Integration, [
+            {"id": uuid4(), "organization_id": org.id, "scopes": [], **int_data}
+            for int_data in integrations_data
+        ])
 
         # ── Calculation Runs (2) ──────────────────────────
         run1 = CalculationRun(
@@ -262,7 +316,6 @@ async def seed():
             total_combined_credit=Decimal("40123.00"),
             engine_versions={"premium_engine": "v1.0.0", "occupation_ai": "v1.0.0"},
         )
-        db.add(run1)
 
         run2 = CalculationRun(
             id=uuid4(),
@@ -276,7 +329,7 @@ async def seed():
             status="calculating",
             engine_versions={"premium_engine": "v1.0.0", "occupation_ai": "v1.0.0"},
         )
-        db.add(run2)
+        db.add_all([run1, run2])
 
         await db.flush()
 
@@ -6,16 +6,18 @@ Provides async test client, database fixtures, and authentication helpers.
 
 import asyncio
 import hashlib
+import os
 import secrets
 from collections.abc import AsyncGenerator
-from datetime import date, datetime, timedelta, timezone
-from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from backend.config import get_settings
 from backend.db.session import get_db
@@ -24,44 +26,157 @@ from backend.models.base import Base
 from backend.models.api_key import APIKey
 from backend.models.organization import Organization
 from backend.models.user import User
-from backend.services.auth import create_access_token, hash_password
+from backend.services.auth import create_access_token, hash_password, pwd_context
 
 settings = get_settings()
 
-# Use a separate test database
+# Use a separate test database; under pytest-xdist each worker gets its own
+# (safeharbor_test_gw0, safeharbor_test_gw1, ...) cloned from a shared
+# safeharbor_test_template, so schemas never collide.
 TEST_DATABASE_URL = settings.database_url.replace("/safeharbor", "/safeharbor_test")
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    _url = make_url(TEST_DATABASE_URL)
+    TEMPLATE_DATABASE = f"{_url.database}_template"
+    TEST_DATABASE_URL = _url.set(database=f"{_url.database}_{XDIST_WORKER}").render_as_string(
+        hide_password=False
+    )
 
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+# Tests reuse pooled connections; the database is local, so skip pre-ping.
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=3600,
+    pool_pre_ping=False,
+)
 TestSessionLocal = async_sessionmaker(
     test_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+# Tests need bcrypt's format, not its cost; 4 is the minimum round count.
+# This must run before any fixture or factory hashes a password.
+pwd_context.update(bcrypt__rounds=4)
+
+# Hash the fixture password once per session.
+_OWNER_PASSWORD_HASH = hash_password("TestPass123!")
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for session-scoped fixtures."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the suite on uvloop when it is installed (uvicorn[standard] pulls it in)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Provide a clean database session for each test."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test on the session loop that owns the pooled connections."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
 
-    async with TestSessionLocal() as session:
-        yield session
+async def _clone_worker_database(run_id: str) -> None:
+    """
+    Give this xdist worker a fresh database cloned from the shared template.
 
+    The first worker of a run builds the schema into the template; the others
+    wait on an advisory lock and then clone it, so create_all runs once per
+    run instead of once per worker. The template is tagged with the run id so
+    a later run rebuilds it after model changes.
+    """
+    url = make_url(TEST_DATABASE_URL)
+    admin_engine = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+    lock = {"name": TEMPLATE_DATABASE}
+    try:
+        async with admin_engine.connect() as conn:
+            await conn.execute(text("SELECT pg_advisory_lock(hashtext(:name))"), lock)
+            try:
+                built_for = await conn.scalar(
+                    text(
+                        "SELECT shobj_description(oid, 'pg_database') "
+                        "FROM pg_database WHERE datname = :name"
+                    ),
+                    lock,
+                )
+                if built_for != run_id:
+                    await conn.execute(text(f'DROP DATABASE IF EXISTS "{TEMPLATE_DATABASE}"'))
+                    await conn.execute(text(f'CREATE DATABASE "{TEMPLATE_DATABASE}"'))
+                    template_engine = create_async_engine(
+                        url.set(database=TEMPLATE_DATABASE), poolclass=NullPool
+                    )
+                    try:
+                        async with template_engine.begin() as template_conn:
+                            await template_conn.run_sync(Base.metadata.create_all)
+                    finally:
+                        await template_engine.dispose()
+                    # run_id is xdist's hex testrunuid, safe to inline.
+                    await conn.execute(
+                        text(f"COMMENT ON DATABASE \"{TEMPLATE_DATABASE}\" IS '{run_id}'")
+                    )
+                await conn.execute(text(f'DROP DATABASE IF EXISTS "{url.database}" WITH (FORCE)'))
+                await conn.execute(
+                    text(f'CREATE DATABASE "{url.database}" TEMPLATE "{TEMPLATE_DATABASE}"')
+                )
+            finally:
+                await conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), lock)
+    finally:
+        await admin_engine.dispose()
+
+
+async def _rebuild_schema(create: bool) -> None:
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        if create:
+            await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_schema(request: pytest.FixtureRequest) -> AsyncGenerator[None, None]:
+    """Create the schema once per test session."""
+    if XDIST_WORKER:
+        await _clone_worker_database(request.config.workerinput["testrunuid"])
+    else:
+        await _rebuild_schema(create=True)
+    yield
+    await _rebuild_schema(create=False)
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def db_session(db_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a clean database session for each test.
+
+    The test runs inside an outer transaction that is rolled back afterwards;
+    commits made by the code under test only release a SAVEPOINT.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        async with TestSessionLocal(bind=conn, join_transaction_mode="create_savepoint") as session:
+            yield session
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One ASGI client for the whole session; ``client`` scopes it per test."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
     """Provide an async test client with dependency override."""
 
     async def override_get_db():
@@ -69,11 +184,11 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
     app.dependency_overrides[get_db] = override_get_db
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-    app.dependency_overrides.clear()
+    try:
+        yield http_client
+    finally:
+        app.dependency_overrides.clear()
+        http_client.cookies.clear()
 
 
 @pytest_asyncio.fixture
@@ -104,7 +219,7 @@ async def test_user(db_session: AsyncSession, test_org: Organization) -> User:
         organization_id=test_org.id,
         email="owner@test.com",
         name="Test Owner",
-        hashed_password=hash_password("TestPass123!"),
+        hashed_password=_OWNER_PASSWORD_HASH,
         role="owner",
         is_active=True,
         is_verified=True,
@@ -126,6 +241,17 @@ async def auth_headers(test_user: User, test_org: Organization) -> dict[str, str
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest_asyncio.fixture
+async def login_tokens(client: AsyncClient, test_user: User) -> dict:
+    """Log the test user in through the API and return the token response."""
+    response = await client.post(
+        "http://test/api/v1/auth/login",
+        json={"email": test_user.email, "password": "TestPass123!"},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
 @pytest_asyncio.fixture
 async def test_api_key(
     db_session: AsyncSession, test_org: Organization, test_user: User
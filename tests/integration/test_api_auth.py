@@ -45,27 +45,19 @@ async def test_register_success(client):
 
 
 @pytest.mark.asyncio
-async def test_register_duplicate_email(client, test_user):
-    """Registering with an already-taken email returns 409."""
-    payload = _register_payload(
-        email="owner@test.com",  # same as test_user
-        ein="22-2222222",
-        org_name="Duplicate Email Org",
-    )
-    response = await client.post(f"{BASE}/register", json=payload)
-
-    assert response.status_code == 409
-
-
-@pytest.mark.asyncio
-async def test_register_duplicate_ein(client, test_org):
-    """Registering with an already-taken EIN returns 409."""
-    payload = _register_payload(
-        email="unique@example.com",
-        ein="99-9999999",  # same as test_org
-        org_name="Duplicate EIN Org",
-    )
-    response = await client.post(f"{BASE}/register", json=payload)
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        # Same email as test_user.
+        {"email": "owner@test.com", "ein": "22-2222222", "org_name": "Duplicate Email Org"},
+        # Same EIN as test_org.
+        {"email": "unique@example.com", "ein": "99-9999999", "org_name": "Duplicate EIN Org"},
+    ],
+    ids=["email", "ein"],
+)
+async def test_register_duplicate(client, test_user, overrides):
+    """Registering with an already-taken email or EIN returns 409."""
+    response = await client.post(f"{BASE}/register", json=_register_payload(**overrides))
 
     assert response.status_code == 409
 
@@ -91,6 +83,17 @@ async def test_login_success(client, test_user):
     assert isinstance(data["expires_in"], int)
 
 
+@pytest.mark.asyncio
+async def test_login_email_case_insensitive(client, test_user):
+    """Email matching ignores case, so a differently-cased login succeeds."""
+    response = await client.post(
+        f"{BASE}/login",
+        json={"email": "Owner@Test.com", "password": "TestPass123!"},
+    )
+
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_login_wrong_password(client, test_user):
     """Logging in with the wrong password returns 401."""
@@ -119,20 +122,11 @@ async def test_login_nonexistent_email(client):
 
 
 @pytest.mark.asyncio
-async def test_refresh_token_success(client, test_user):
+async def test_refresh_token_success(client, login_tokens):
     """Using a valid refresh token returns 200 and a new token pair."""
-    # First, login to obtain tokens.
-    login_resp = await client.post(
-        f"{BASE}/login",
-        json={"email": "owner@test.com", "password": "TestPass123!"},
-    )
-    assert login_resp.status_code == 200
-    refresh_token = login_resp.json()["refresh_token"]
-
-    # Use the refresh token.
     response = await client.post(
         f"{BASE}/refresh",
-        json={"refresh_token": refresh_token},
+        json={"refresh_token": login_tokens["refresh_token"]},
     )
 
     assert response.status_code == 200
@@ -142,18 +136,11 @@ async def test_refresh_token_success(client, test_user):
 
 
 @pytest.mark.asyncio
-async def test_refresh_with_access_token(client, test_user):
+async def test_refresh_with_access_token(client, login_tokens):
     """Passing an access token where a refresh token is expected returns 401."""
-    login_resp = await client.post(
-        f"{BASE}/login",
-        json={"email": "owner@test.com", "password": "TestPass123!"},
-    )
-    assert login_resp.status_code == 200
-    access_token = login_resp.json()["access_token"]
-
     response = await client.post(
         f"{BASE}/refresh",
-        json={"refresh_token": access_token},
+        json={"refresh_token": login_tokens["access_token"]},
     )
 
     assert response.status_code == 401
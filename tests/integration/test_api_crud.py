@@ -5,17 +5,22 @@ Tests cover Organizations, Employees, Calculations, and Admin endpoints
 using the async test client, database fixtures, and factory helpers.
 """
 
-from uuid import uuid4
-
 import pytest
-import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.models.employee import Employee
 from backend.models.organization import Organization
 from backend.models.user import User
 from backend.services.auth import create_access_token
-from tests.factories import make_calculation_run, make_employee, make_user
+from tests.factories import (
+    make_api_key,
+    make_calculation_run,
+    make_employee,
+    make_employees_bulk,
+    make_user,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -100,8 +105,7 @@ async def test_list_employees(
     """GET /api/v1/organizations/{org_id}/employees returns 200 with results after creating employees."""
     emp1 = make_employee(test_org.id, first_name="Alice", last_name="Anderson")
     emp2 = make_employee(test_org.id, first_name="Bob", last_name="Brown")
-    db_session.add(emp1)
-    db_session.add(emp2)
+    db_session.add_all([emp1, emp2])
     await db_session.flush()
 
     response = await client.get(
@@ -141,6 +145,24 @@ async def test_get_employee_detail(
     assert data["id"] == str(emp.id)
 
 
+@pytest.mark.asyncio
+async def test_make_employees_bulk_with_overrides(
+    db_session: AsyncSession,
+    test_org: Organization,
+) -> None:
+    """make_employees_bulk inserts every row and lets callers override any column."""
+    ids = await make_employees_bulk(
+        db_session, test_org.id, 3, first_name="Dana", job_title="Cook"
+    )
+
+    result = await db_session.execute(
+        select(Employee.first_name, Employee.job_title).where(Employee.id.in_(ids))
+    )
+    rows = result.all()
+    assert len(rows) == 3
+    assert {tuple(row) for row in rows} == {("Dana", "Cook")}
+
+
 # ---------------------------------------------------------------------------
 # Calculation Tests
 # ---------------------------------------------------------------------------
@@ -248,20 +270,17 @@ async def test_create_api_key(
 @pytest.mark.asyncio
 async def test_list_api_keys(
     client: AsyncClient,
+    db_session: AsyncSession,
     test_org: Organization,
+    test_user: User,
     auth_headers: dict[str, str],
 ) -> None:
-    """After creating an API key, GET /api/v1/organizations/{org_id}/admin/api-keys returns it."""
-    # Create a key first
-    create_response = await client.post(
-        f"/api/v1/organizations/{test_org.id}/admin/api-keys",
-        json={"name": "List Test Key"},
-        headers=auth_headers,
-    )
-    assert create_response.status_code == 201
-    created_key = create_response.json()
+    """An existing API key is listed by GET /api/v1/organizations/{org_id}/admin/api-keys."""
+    # Creation over HTTP is covered by test_create_api_key; insert directly here.
+    key, _ = make_api_key(test_org.id, test_user.id, name="List Test Key")
+    db_session.add(key)
+    await db_session.flush()
 
-    # List keys
     response = await client.get(
         f"/api/v1/organizations/{test_org.id}/admin/api-keys",
         headers=auth_headers,
@@ -273,9 +292,9 @@ async def test_list_api_keys(
     key_names = {key["name"] for key in data}
     assert "List Test Key" in key_names
 
-    # Verify the created key appears in the list by ID
+    # Verify the inserted key appears in the list by ID
     key_ids = {key["id"] for key in data}
-    assert created_key["id"] in key_ids
+    assert str(key.id) in key_ids
 
 
 @pytest.mark.asyncio
@@ -5,28 +5,70 @@ Verifies that users in Organization A cannot access
 Organization B's resources across all API endpoints.
 """
 
-import hashlib
-import secrets
-from uuid import uuid4
+from collections.abc import AsyncGenerator
+from uuid import UUID
 
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from backend.models.employee import Employee
 from backend.models.integration import Integration
 from backend.models.organization import Organization
 from backend.models.user import User
 from backend.services.auth import create_access_token, hash_password
-from tests.factories import make_calculation_run, make_employee, make_integration
+from tests.conftest import TestSessionLocal, test_engine
+from tests.factories import make_employee, make_integration
+
+# Fixed ids keep the shared tenant rows recognisable in logs and failures.
+ORG_A_ID = UUID("10000000-0000-0000-0000-000000000001")
+ORG_B_ID = UUID("20000000-0000-0000-0000-000000000002")
+USER_A_ID = UUID("10000000-0000-0000-0000-0000000000a1")
+USER_B_ID = UUID("20000000-0000-0000-0000-0000000000b2")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def tenant_connection(db_schema: None) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    One connection for the whole module, inside a transaction rolled back at the end.
+
+    The tenant rows below are inserted into it once and shared by every test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def tenant_session(tenant_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
+    """Session that writes the shared tenant rows into the module transaction."""
+    async with TestSessionLocal(bind=tenant_connection) as session:
+        yield session
 
 
 @pytest_asyncio.fixture
-async def org_a(db_session: AsyncSession) -> Organization:
-    """Organization A."""
-    org = Organization(
-        id=uuid4(),
+async def db_session(tenant_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Per-test session on the module connection.
+
+    Each test runs inside its own SAVEPOINT, so anything it writes or commits
+    is discarded while the shared tenant rows stay in place.
+    """
+    savepoint = await tenant_connection.begin_nested()
+    async with TestSessionLocal(
+        bind=tenant_connection, join_transaction_mode="create_savepoint"
+    ) as session:
+        yield session
+    await savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def tenants(tenant_session: AsyncSession) -> dict:
+    """Both organizations, their owners and Org B's resources, in one flush."""
+    org_a = Organization(
+        id=ORG_A_ID,
         name="Org Alpha",
         ein="10-1000001",
         tax_year=2025,
@@ -37,16 +79,8 @@ async def org_a(db_session: AsyncSession) -> Organization:
         workweek_start="monday",
         settings={},
     )
-    db_session.add(org)
-    await db_session.flush()
-    return org
-
-
-@pytest_asyncio.fixture
-async def org_b(db_session: AsyncSession) -> Organization:
-    """Organization B."""
-    org = Organization(
-        id=uuid4(),
+    org_b = Organization(
+        id=ORG_B_ID,
         name="Org Bravo",
         ein="20-2000002",
         tax_year=2025,
@@ -57,48 +91,75 @@ async def org_b(db_session: AsyncSession) -> Organization:
         workweek_start="sunday",
         settings={},
     )
-    db_session.add(org)
-    await db_session.flush()
-    return org
+    rows = {
+        "org_a": org_a,
+        "org_b": org_b,
+        "user_a": User(
+            id=USER_A_ID,
+            organization_id=org_a.id,
+            email="owner@alpha.com",
+            name="Alpha Owner",
+            hashed_password=hash_password("AlphaPass1!"),
+            role="owner",
+            is_active=True,
+            is_verified=True,
+        ),
+        "user_b": User(
+            id=USER_B_ID,
+            organization_id=org_b.id,
+            email="owner@bravo.com",
+            name="Bravo Owner",
+            hashed_password=hash_password("BravoPass1!"),
+            role="owner",
+            is_active=True,
+            is_verified=True,
+        ),
+        "employee_b": make_employee(org_b.id, first_name="Bravo", last_name="Employee"),
+        "integration_b": make_integration(org_b.id, provider="gusto"),
+    }
+    # Every child has an organization relationship, so one flush orders the INSERTs.
+    tenant_session.add_all(rows.values())
+    await tenant_session.flush()
+    return rows
+
+
+@pytest.fixture(scope="module")
+def org_a(tenants: dict) -> Organization:
+    """Organization A."""
+    return tenants["org_a"]
 
 
-@pytest_asyncio.fixture
-async def user_a(db_session: AsyncSession, org_a: Organization) -> User:
+@pytest.fixture(scope="module")
+def org_b(tenants: dict) -> Organization:
+    """Organization B."""
+    return tenants["org_b"]
+
+
+@pytest.fixture(scope="module")
+def user_a(tenants: dict) -> User:
     """Owner of Org A."""
-    user = User(
-        id=uuid4(),
-        organization_id=org_a.id,
-        email="owner@alpha.com",
-        name="Alpha Owner",
-        hashed_password=hash_password("AlphaPass1!"),
-        role="owner",
-        is_active=True,
-        is_verified=True,
-    )
-    db_session.add(user)
-    await db_session.flush()
-    return user
+    return tenants["user_a"]
 
 
-@pytest_asyncio.fixture
-async def user_b(db_session: AsyncSession, org_b: Organization) -> User:
+@pytest.fixture(scope="module")
+def user_b(tenants: dict) -> User:
     """Owner of Org B."""
-    user = User(
-        id=uuid4(),
-        organization_id=org_b.id,
-        email="owner@bravo.com",
-        name="Bravo Owner",
-        hashed_password=hash_password("BravoPass1!"),
-        role="owner",
-        is_active=True,
-        is_verified=True,
-    )
-    db_session.add(user)
-    await db_session.flush()
-    return user
+    return tenants["user_b"]
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="module")
+def employee_b(tenants: dict) -> Employee:
+    """Employee belonging to Org B."""
+    return tenants["employee_b"]
+
+
+@pytest.fixture(scope="module")
+def integration_b(tenants: dict) -> Integration:
+    """Integration belonging to Org B."""
+    return tenants["integration_b"]
+
+
+@pytest.fixture(scope="module")
 def headers_a(user_a: User, org_a: Organization) -> dict:
     """Auth headers for Org A user."""
     token = create_access_token(
@@ -110,7 +171,7 @@ def headers_a(user_a: User, org_a: Organization) -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="module")
 def headers_b(user_b: User, org_b: Organization) -> dict:
     """Auth headers for Org B user."""
     token = create_access_token(
@@ -122,185 +183,63 @@ def headers_b(user_b: User, org_b: Organization) -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest_asyncio.fixture
-async def employee_b(db_session: AsyncSession, org_b: Organization) -> Employee:
-    """Employee belonging to Org B."""
-    emp = make_employee(org_b.id, first_name="Bravo", last_name="Employee")
-    db_session.add(emp)
-    await db_session.flush()
-    return emp
-
-
-@pytest_asyncio.fixture
-async def integration_b(db_session: AsyncSession, org_b: Organization) -> Integration:
-    """Integration belonging to Org B."""
-    integ = make_integration(org_b.id, provider="gusto")
-    db_session.add(integ)
-    await db_session.flush()
-    return integ
-
-
-# ── Organization Access Tests ─────────────────────────
+# ── Cross-Tenant Access Tests ───────────────────────
 
+ORG_B = "http://test/api/v1/organizations/{org_id}"
 
-@pytest.mark.asyncio
-async def test_user_a_cannot_read_org_b(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to read Org B's details."""
-    resp = await client.get(
-        f"http://test/api/v1/organizations/{org_b.id}",
-        headers=headers_a,
-    )
-    assert resp.status_code == 403
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_update_org_b(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to update Org B."""
-    resp = await client.patch(
-        f"http://test/api/v1/organizations/{org_b.id}",
-        headers=headers_a,
-        json={"name": "Hacked Name"},
-    )
-    assert resp.status_code == 403
-
-
-# ── Employee Access Tests ─────────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_list_org_b_employees(
-    client: AsyncClient, headers_a: dict, org_b: Organization, employee_b: Employee,
-):
-    """User A should not be able to list Org B's employees."""
-    resp = await client.get(
-        f"http://test/api/v1/organizations/{org_b.id}/employees",
-        headers=headers_a,
-    )
-    assert resp.status_code == 403
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_read_org_b_employee(
-    client: AsyncClient, headers_a: dict, org_b: Organization, employee_b: Employee,
-):
-    """User A should not be able to read a specific Org B employee."""
-    resp = await client.get(
-        f"http://test/api/v1/organizations/{org_b.id}/employees/{employee_b.id}",
-        headers=headers_a,
-    )
-    assert resp.status_code == 403
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_create_employee_in_org_b(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to create an employee in Org B."""
-    resp = await client.post(
-        f"http://test/api/v1/organizations/{org_b.id}/employees",
-        headers=headers_a,
-        json={
+# (method, path template, JSON body) for requests User A must not be allowed to make.
+ISOLATION_CASES = [
+    # Organization
+    pytest.param("GET", ORG_B, None, id="read_org"),
+    pytest.param("PATCH", ORG_B, {"name": "Hacked Name"}, id="update_org"),
+    # Employees
+    pytest.param("GET", ORG_B + "/employees", None, id="list_employees"),
+    pytest.param("GET", ORG_B + "/employees/{employee_id}", None, id="read_employee"),
+    pytest.param(
+        "POST",
+        ORG_B + "/employees",
+        {
             "first_name": "Injected",
             "last_name": "Employee",
             "ssn": "999-99-9999",
             "hire_date": "2024-01-01",
             "job_title": "Attacker",
         },
-    )
-    assert resp.status_code == 403
-
-
-# ── Calculation Access Tests ──────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_create_calc_in_org_b(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to create a calculation run in Org B."""
-    resp = await client.post(
-        f"http://test/api/v1/organizations/{org_b.id}/calculations",
-        headers=headers_a,
-        json={
-            "run_type": "pay_period",
-            "period_start": "2025-05-01",
-            "period_end": "2025-05-15",
-        },
-    )
-    assert resp.status_code == 403
-
-
-# ── Integration Access Tests ──────────────────────────
+        id="create_employee",
+    ),
+    # Calculations
+    pytest.param(
+        "POST",
+        ORG_B + "/calculations",
+        {"run_type": "pay_period", "period_start": "2025-05-01", "period_end": "2025-05-15"},
+        id="create_calc",
+    ),
+    # Integrations
+    pytest.param("GET", ORG_B + "/integrations", None, id="list_integrations"),
+    pytest.param("POST", ORG_B + "/integrations/{integration_id}/sync", None, id="trigger_sync"),
+    # Admin
+    pytest.param("GET", ORG_B + "/admin/users", None, id="list_users"),
+    pytest.param("POST", ORG_B + "/admin/api-keys", {"name": "Stolen Key"}, id="create_api_key"),
+    # Compliance
+    pytest.param("GET", ORG_B + "/compliance/vault", None, id="read_vault"),
+]
 
 
 @pytest.mark.asyncio
-async def test_user_a_cannot_list_org_b_integrations(
-    client: AsyncClient, headers_a: dict, org_b: Organization, integration_b: Integration,
+@pytest.mark.parametrize("method,path,body", ISOLATION_CASES)
+async def test_user_a_cannot_access_org_b(
+    client: AsyncClient,
+    headers_a: dict,
+    org_b: Organization,
+    employee_b: Employee,
+    integration_b: Integration,
+    method: str,
+    path: str,
+    body: dict | None,
 ):
-    """User A should not be able to list Org B's integrations."""
-    resp = await client.get(
-        f"http://test/api/v1/organizations/{org_b.id}/integrations",
-        headers=headers_a,
-    )
-    assert resp.status_code == 403
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_trigger_sync_on_org_b(
-    client: AsyncClient, headers_a: dict, org_b: Organization, integration_b: Integration,
-):
-    """User A should not be able to trigger a sync for Org B's integration."""
-    resp = await client.post(
-        f"http://test/api/v1/organizations/{org_b.id}/integrations/{integration_b.id}/sync",
-        headers=headers_a,
-    )
-    assert resp.status_code == 403
-
-
-# ── Admin Access Tests ────────────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_list_org_b_users(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to list Org B's users."""
-    resp = await client.get(
-        f"http://test/api/v1/organizations/{org_b.id}/admin/users",
-        headers=headers_a,
-    )
-    assert resp.status_code == 403
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_create_api_key_for_org_b(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to create an API key for Org B."""
-    resp = await client.post(
-        f"http://test/api/v1/organizations/{org_b.id}/admin/api-keys",
-        headers=headers_a,
-        json={"name": "Stolen Key"},
-    )
-    assert resp.status_code == 403
-
-
-# ── Compliance Access Tests ───────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_user_a_cannot_access_org_b_vault(
-    client: AsyncClient, headers_a: dict, org_b: Organization,
-):
-    """User A should not be able to access Org B's compliance vault."""
-    resp = await client.get(
-        f"http://test/api/v1/organizations/{org_b.id}/compliance/vault",
-        headers=headers_a,
-    )
+    """User A must get 403 for every Org B resource."""
+    url = path.format(org_id=org_b.id, employee_id=employee_b.id, integration_id=integration_b.id)
+    resp = await client.request(method, url, headers=headers_a, json=body)
     assert resp.status_code == 403
 
 
@@ -32,6 +32,64 @@ SAMPLE_ORG_ID = "org-uuid-5678"
 SAMPLE_ROLE = "admin"
 
 
+def _sample_token(secret: str, issued: datetime, lifetime: timedelta) -> str:
+    """Sign an access token for the SAMPLE_* identity by hand."""
+    payload = {
+        "sub": SAMPLE_SUB,
+        "email": SAMPLE_EMAIL,
+        "org_id": SAMPLE_ORG_ID,
+        "role": SAMPLE_ROLE,
+        "type": "access",
+        "iat": issued,
+        "exp": issued + lifetime,
+    }
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+_NOW = datetime.now(timezone.utc)
+
+# Issued two hours ago, expired one hour ago.
+EXPIRED_TOKEN = _sample_token(settings.secret_key, _NOW - timedelta(hours=2), timedelta(hours=1))
+
+# Still valid, but signed with a different secret.
+TAMPERED_TOKEN = _sample_token("completely-different-secret", _NOW, timedelta(hours=1))
+
+
+@pytest.fixture(scope="module")
+def sample_hash() -> str:
+    """One bcrypt hash of SAMPLE_PASSWORD shared by the verification tests."""
+    return hash_password(SAMPLE_PASSWORD)
+
+
+@pytest.fixture(scope="module")
+def sample_access_token() -> str:
+    """Access token for the SAMPLE_* identity, signed once per module."""
+    return create_access_token(
+        sub=SAMPLE_SUB,
+        email=SAMPLE_EMAIL,
+        org_id=SAMPLE_ORG_ID,
+        role=SAMPLE_ROLE,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_refresh_token() -> str:
+    """Refresh token for the SAMPLE_* identity, signed once per module."""
+    return create_refresh_token(sub=SAMPLE_SUB, org_id=SAMPLE_ORG_ID)
+
+
+@pytest.fixture(scope="module")
+def sample_access_payload(sample_access_token) -> dict:
+    """Claims of sample_access_token, verified and decoded once per module."""
+    return jwt.decode(sample_access_token, settings.secret_key, algorithms=["HS256"])
+
+
+@pytest.fixture(scope="module")
+def sample_refresh_payload(sample_refresh_token) -> dict:
+    """Claims of sample_refresh_token, verified and decoded once per module."""
+    return jwt.decode(sample_refresh_token, settings.secret_key, algorithms=["HS256"])
+
+
 # ---------------------------------------------------------------------------
 # 1. Password hashing produces different outputs (bcrypt salting)
 # ---------------------------------------------------------------------------
@@ -46,32 +104,24 @@ def test_hash_password_produces_different_hashes_for_same_input():
 # 2. Password verification succeeds for correct password
 # ---------------------------------------------------------------------------
 
-def test_verify_password_correct():
-    hashed = hash_password(SAMPLE_PASSWORD)
-    assert verify_password(SAMPLE_PASSWORD, hashed) is True
+def test_verify_password_correct(sample_hash):
+    assert verify_password(SAMPLE_PASSWORD, sample_hash) is True
 
 
 # ---------------------------------------------------------------------------
 # 3. Password verification fails for wrong password
 # ---------------------------------------------------------------------------
 
-def test_verify_password_wrong():
-    hashed = hash_password(SAMPLE_PASSWORD)
-    assert verify_password("WrongPassword!", hashed) is False
+def test_verify_password_wrong(sample_hash):
+    assert verify_password("WrongPassword!", sample_hash) is False
 
 
 # ---------------------------------------------------------------------------
 # 4. Access token contains correct claims
 # ---------------------------------------------------------------------------
 
-def test_access_token_claims():
-    token = create_access_token(
-        sub=SAMPLE_SUB,
-        email=SAMPLE_EMAIL,
-        org_id=SAMPLE_ORG_ID,
-        role=SAMPLE_ROLE,
-    )
-    payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+def test_access_token_claims(sample_access_payload):
+    payload = sample_access_payload
 
     assert payload["sub"] == SAMPLE_SUB
     assert payload["email"] == SAMPLE_EMAIL
@@ -86,36 +136,23 @@ def test_access_token_claims():
 # 5. Access token has valid expiry (~60 minutes by default)
 # ---------------------------------------------------------------------------
 
-def test_access_token_expiry():
-    before = datetime.now(timezone.utc)
-    token = create_access_token(
-        sub=SAMPLE_SUB,
-        email=SAMPLE_EMAIL,
-        org_id=SAMPLE_ORG_ID,
-        role=SAMPLE_ROLE,
-    )
-    after = datetime.now(timezone.utc)
-
-    payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
-    exp = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
-    iat = datetime.fromtimestamp(payload["iat"], tz=timezone.utc)
+def test_access_token_expiry(sample_access_payload):
+    # Both claims come from the same clock read inside create_access_token,
+    # so the lifetime check needs no wall-clock bracketing here. jwt.decode
+    # has already rejected the token if exp were in the past.
+    exp = datetime.fromtimestamp(sample_access_payload["exp"], tz=timezone.utc)
+    iat = datetime.fromtimestamp(sample_access_payload["iat"], tz=timezone.utc)
 
     expected_delta = timedelta(minutes=settings.access_token_expire_minutes)
-    # The difference between exp and iat should match the configured minutes
-    actual_delta = exp - iat
-    assert actual_delta == expected_delta
-
-    # exp should be in the future relative to before the call
-    assert exp > before
+    assert exp - iat == expected_delta
 
 
 # ---------------------------------------------------------------------------
 # 6. Refresh token contains correct claims
 # ---------------------------------------------------------------------------
 
-def test_refresh_token_claims():
-    token = create_refresh_token(sub=SAMPLE_SUB, org_id=SAMPLE_ORG_ID)
-    payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+def test_refresh_token_claims(sample_refresh_payload):
+    payload = sample_refresh_payload
 
     assert payload["sub"] == SAMPLE_SUB
     assert payload["org_id"] == SAMPLE_ORG_ID
@@ -131,17 +168,9 @@ def test_refresh_token_claims():
 # 7. Refresh token has longer expiry than access token
 # ---------------------------------------------------------------------------
 
-def test_refresh_token_longer_expiry():
-    access = create_access_token(
-        sub=SAMPLE_SUB,
-        email=SAMPLE_EMAIL,
-        org_id=SAMPLE_ORG_ID,
-        role=SAMPLE_ROLE,
-    )
-    refresh = create_refresh_token(sub=SAMPLE_SUB, org_id=SAMPLE_ORG_ID)
-
-    access_payload = jwt.decode(access, settings.secret_key, algorithms=["HS256"])
-    refresh_payload = jwt.decode(refresh, settings.secret_key, algorithms=["HS256"])
+def test_refresh_token_longer_expiry(sample_access_payload, sample_refresh_payload):
+    access_payload = sample_access_payload
+    refresh_payload = sample_refresh_payload
 
     access_exp = datetime.fromtimestamp(access_payload["exp"], tz=timezone.utc)
     refresh_exp = datetime.fromtimestamp(refresh_payload["exp"], tz=timezone.utc)
@@ -158,14 +187,8 @@ def test_refresh_token_longer_expiry():
 # 8. decode_token round-trips correctly
 # ---------------------------------------------------------------------------
 
-def test_decode_token_roundtrip_access():
-    token = create_access_token(
-        sub=SAMPLE_SUB,
-        email=SAMPLE_EMAIL,
-        org_id=SAMPLE_ORG_ID,
-        role=SAMPLE_ROLE,
-    )
-    payload = decode_token(token)
+def test_decode_token_roundtrip_access(sample_access_token):
+    payload = decode_token(sample_access_token)
 
     assert payload["sub"] == SAMPLE_SUB
     assert payload["email"] == SAMPLE_EMAIL
@@ -174,9 +197,8 @@ def test_decode_token_roundtrip_access():
     assert payload["type"] == "access"
 
 
-def test_decode_token_roundtrip_refresh():
-    token = create_refresh_token(sub=SAMPLE_SUB, org_id=SAMPLE_ORG_ID)
-    payload = decode_token(token)
+def test_decode_token_roundtrip_refresh(sample_refresh_token):
+    payload = decode_token(sample_refresh_token)
 
     assert payload["sub"] == SAMPLE_SUB
     assert payload["org_id"] == SAMPLE_ORG_ID
@@ -188,21 +210,8 @@ def test_decode_token_roundtrip_refresh():
 # ---------------------------------------------------------------------------
 
 def test_decode_token_expired():
-    # Manually craft a token that already expired
-    now = datetime.now(timezone.utc)
-    payload = {
-        "sub": SAMPLE_SUB,
-        "email": SAMPLE_EMAIL,
-        "org_id": SAMPLE_ORG_ID,
-        "role": SAMPLE_ROLE,
-        "type": "access",
-        "iat": now - timedelta(hours=2),
-        "exp": now - timedelta(hours=1),  # expired 1 hour ago
-    }
-    token = jwt.encode(payload, settings.secret_key, algorithm="HS256")
-
     with pytest.raises(jwt.ExpiredSignatureError):
-        decode_token(token)
+        decode_token(EXPIRED_TOKEN)
 
 
 # ---------------------------------------------------------------------------
@@ -224,18 +233,5 @@ def test_decode_token_empty_string():
 # ---------------------------------------------------------------------------
 
 def test_decode_token_tampered_wrong_secret():
-    # Create a valid token signed with a different secret
-    now = datetime.now(timezone.utc)
-    payload = {
-        "sub": SAMPLE_SUB,
-        "email": SAMPLE_EMAIL,
-        "org_id": SAMPLE_ORG_ID,
-        "role": SAMPLE_ROLE,
-        "type": "access",
-        "iat": now,
-        "exp": now + timedelta(hours=1),
-    }
-    token = jwt.encode(payload, "completely-different-secret", algorithm="HS256")
-
     with pytest.raises(jwt.InvalidSignatureError):
-        decode_token(token)
+        decode_token(TAMPERED_TOKEN)
@@ -2,7 +2,7 @@
 Unit Tests for RBAC Middleware
 
 Tests role-permission mappings, CurrentUser helper methods,
-and JWT token validation logic.
+JWT token validation logic, and the organization access check.
 """
 
 from datetime import datetime, timedelta, timezone
@@ -10,6 +10,7 @@ from uuid import uuid4
 
 import jwt
 import pytest
+from starlette.requests import Request
 
 from backend.config import get_settings
 from backend.middleware.rbac import (
@@ -18,6 +19,7 @@ from backend.middleware.rbac import (
     Permission,
     Role,
     _validate_token,
+    require_org_access,
 )
 from backend.services.auth import create_access_token
 
@@ -232,3 +234,124 @@ class TestValidateToken:
             await _validate_token(expired_token)
         assert exc_info.value.status_code == 401
         assert "Invalid token" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_missing_org_claim_raises_401(self):
+        """Test 11a: A signed token without an org_id claim is rejected, not a 500."""
+        from fastapi import HTTPException
+
+        token = jwt.encode(
+            {
+                "sub": str(uuid4()),
+                "email": "no-org@test.com",
+                "role": "viewer",
+                "exp": datetime.now(timezone.utc) + timedelta(hours=1),
+            },
+            settings.secret_key,
+            algorithm="HS256",
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _validate_token(token)
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_cached(self, monkeypatch):
+        """Test 11b: Validating the same token twice decodes it only once."""
+        calls = []
+        real_decode = jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            calls.append(args[0])
+            return real_decode(*args, **kwargs)
+
+        monkeypatch.setattr(jwt, "decode", counting_decode)
+        token = create_access_token(
+            sub=str(uuid4()),
+            email="cached@safeharbor.test",
+            org_id=str(uuid4()),
+            role=Role.VIEWER.value,
+        )
+
+        first = await _validate_token(token)
+        second = await _validate_token(token)
+
+        assert second is first
+        assert calls == [token]
+
+    @pytest.mark.asyncio
+    async def test_malformed_token_skips_decode(self, monkeypatch):
+        """Test 11c: Tokens that are not three base64url segments never reach jwt.decode."""
+        from fastapi import HTTPException
+
+        calls = []
+        monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: calls.append(args[0]))
+
+        for token in ("this.is.not.a.jwt", "onlyone", "a.b.c d", "a.b.c=="):
+            with pytest.raises(HTTPException) as exc_info:
+                await _validate_token(token)
+            assert exc_info.value.status_code == 401
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_role_raises_401(self):
+        """Test 11d: A signed token carrying an unknown role is rejected, not a 500."""
+        from fastapi import HTTPException
+
+        token = create_access_token(
+            sub=str(uuid4()),
+            email="superuser@test.com",
+            org_id=str(uuid4()),
+            role="superuser",
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _validate_token(token)
+        assert exc_info.value.status_code == 401
+
+
+# ===========================================================================
+# 12-14  require_org_access tests (async)
+# ===========================================================================
+
+def _request_for_org(org_id: str) -> Request:
+    """Build a bare request whose path parameters carry ``org_id``."""
+    return Request({"type": "http", "path_params": {"org_id": org_id}})
+
+
+class TestRequireOrgAccess:
+    """Call the org-access dependency directly, without the HTTP stack."""
+
+    @pytest.mark.asyncio
+    async def test_own_org_allowed(self):
+        """Test 12: A user may access their own organization."""
+        user = _make_user(Role.OWNER)
+        check = require_org_access()
+
+        assert await check(_request_for_org(str(user.organization_id)), user) is user
+
+    @pytest.mark.asyncio
+    async def test_other_org_raises_403(self):
+        """Test 13: Any other organization id is rejected with 403, whatever the role."""
+        from fastapi import HTTPException
+
+        user = _make_user(Role.OWNER)
+        check = require_org_access()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await check(_request_for_org(str(uuid4())), user)
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_custom_path_param(self):
+        """Test 14: The org id is read from the configured path parameter."""
+        from fastapi import HTTPException
+
+        user = _make_user(Role.VIEWER)
+        check = require_org_access("organization_id")
+        request = Request({"type": "http", "path_params": {"organization_id": str(uuid4())}})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await check(request, user)
+        assert exc_info.value.status_code == 403
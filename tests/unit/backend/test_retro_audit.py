@@ -4,7 +4,7 @@ Tests for Retro-Audit Report Service
 Tests the risk assessment, discrepancy calculation, and recommendation logic.
 """
 
-import types
+from dataclasses import dataclass
 from decimal import Decimal
 from uuid import uuid4
 
@@ -18,6 +18,13 @@ from backend.services.retro_audit import (
 )
 
 
+@dataclass(slots=True)
+class _OTCalc:
+    """Lightweight calc object with the attributes the OT estimate reads."""
+    hourly_rate: Decimal | None
+    overtime_hours: Decimal | None
+
+
 # ── Risk Assessment Tests ─────────────────────────────
 
 
@@ -91,7 +98,7 @@ class TestEstimateSimpleOTPremium:
 
     def test_basic_calculation(self):
         svc = self._service()
-        calc = types.SimpleNamespace(
+        calc = _OTCalc(
             hourly_rate=Decimal("20.00"),
             overtime_hours=Decimal("10"),
         )
@@ -101,7 +108,7 @@ class TestEstimateSimpleOTPremium:
 
     def test_zero_hours(self):
         svc = self._service()
-        calc = types.SimpleNamespace(
+        calc = _OTCalc(
             hourly_rate=Decimal("15.00"),
             overtime_hours=Decimal("0"),
         )
@@ -109,12 +116,12 @@ class TestEstimateSimpleOTPremium:
 
     def test_missing_rate(self):
         svc = self._service()
-        calc = types.SimpleNamespace(hourly_rate=None, overtime_hours=Decimal("5"))
+        calc = _OTCalc(hourly_rate=None, overtime_hours=Decimal("5"))
         assert svc._estimate_simple_ot_premium(calc) == Decimal("0")
 
     def test_missing_hours(self):
         svc = self._service()
-        calc = types.SimpleNamespace(hourly_rate=Decimal("25.00"), overtime_hours=None)
+        calc = _OTCalc(hourly_rate=Decimal("25.00"), overtime_hours=None)
         assert svc._estimate_simple_ot_premium(calc) == Decimal("0")
 
 
@@ -5,9 +5,9 @@ Tests for W-2 Box 12 value calculation, model defaults,
 batch approval, and batch execution guard.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
@@ -25,14 +25,23 @@ from backend.services.writeback_engine import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class _Calc:
+    """Lightweight calc object with the attributes the engine reads."""
+    qualified_ot_premium: Decimal
+    qualified_tip_credit: Decimal
+    phase_out_percentage: Decimal
+    qualified_senior_wages: Decimal
+
+
 def _make_calc(
     ot_premium: Decimal = Decimal("0"),
     tip_credit: Decimal = Decimal("0"),
     phase_out_pct: Decimal = Decimal("0"),
     senior_wages: Decimal = Decimal("0"),
-) -> SimpleNamespace:
+) -> _Calc:
     """Return a lightweight calc object with the attributes the engine reads."""
-    return SimpleNamespace(
+    return _Calc(
         qualified_ot_premium=ot_premium,
         qualified_tip_credit=tip_credit,
         phase_out_percentage=phase_out_pct,
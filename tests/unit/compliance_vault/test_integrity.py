@@ -8,13 +8,14 @@ using real async database sessions with the ComplianceVault model.
 import hashlib
 import json
 from datetime import datetime, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
 
 from backend.models.compliance_vault import ComplianceVault
 from compliance_vault.integrity import verify_chain, verify_entry
+from compliance_vault.ledger import ComplianceVaultLedger
 
 
 # ---------------------------------------------------------------------------
@@ -22,21 +23,26 @@ from compliance_vault.integrity import verify_chain, verify_entry
 # ---------------------------------------------------------------------------
 
 
-def _content_hash(content: dict) -> str:
+def _content_json(content: dict) -> bytes:
+    """Serialize content deterministically, as the ledger does."""
+    return json.dumps(content, sort_keys=True, default=str).encode()
+
+
+def _content_hash(content_json: bytes) -> str:
     """Compute the SHA-256 content hash matching ledger logic."""
-    content_json = json.dumps(content, sort_keys=True, default=str)
-    return hashlib.sha256(content_json.encode()).hexdigest()
+    return hashlib.sha256(content_json).hexdigest()
 
 
-def _entry_hash(previous_hash_value: str, content: dict, timestamp: datetime) -> str:
+def _entry_hash(previous_hash_value: str, content_json: bytes, timestamp: datetime) -> str:
     """Compute the SHA-256 entry hash matching ledger logic.
 
     ``previous_hash_value`` should be ``"GENESIS"`` for the first entry,
     or the prior entry's ``entry_hash`` for subsequent entries.
     """
-    content_json = json.dumps(content, sort_keys=True, default=str)
-    hash_input = f"{previous_hash_value}|{content_json}|{timestamp.isoformat()}"
-    return hashlib.sha256(hash_input.encode()).hexdigest()
+    hasher = hashlib.sha256(f"{previous_hash_value}|".encode())
+    hasher.update(content_json)
+    hasher.update(f"|{timestamp.isoformat()}".encode())
+    return hasher.hexdigest()
 
 
 def _make_vault_entry(
@@ -54,8 +60,9 @@ def _make_vault_entry(
     ts = timestamp or datetime.utcnow()
     # For hash computation, use "GENESIS" when previous_hash is None (genesis entry)
     hash_prev = previous_hash if previous_hash is not None else "GENESIS"
-    c_hash = _content_hash(content)
-    e_hash = _entry_hash(hash_prev, content, ts)
+    content_json = _content_json(content)
+    c_hash = _content_hash(content_json)
+    e_hash = _entry_hash(hash_prev, content_json, ts)
 
     return ComplianceVault(
         id=uuid4(),
@@ -89,10 +96,10 @@ async def _insert_chain(db_session, organization_id, count: int):
             previous_hash=prev_hash,
             timestamp=ts,
         )
-        db_session.add(entry)
         entries.append(entry)
         prev_hash = entry.entry_hash
 
+    db_session.add_all(entries)
     await db_session.flush()
     return entries
 
@@ -300,3 +307,44 @@ async def test_verify_entry_tampered(db_session, test_org):
     assert result["is_valid"] is False
     assert result["entry_sequence"] == 1
     assert "mismatch" in result["message"].lower() or "tamper" in result["message"].lower()
+
+
+@pytest.mark.asyncio
+async def test_verify_entry_follows_previous_id(db_session, test_org):
+    """Ledger-written entries link to their predecessor by id and verify via that link."""
+    ledger = ComplianceVaultLedger(db_session)
+    first = await ledger.append(test_org.id, "calculation", {"action": "first"})
+    second = await ledger.append(test_org.id, "calculation", {"action": "second"})
+
+    stored = await ledger.get_entry(UUID(second["id"]))
+    assert stored["previous_id"] == first["id"]
+    assert stored["previous_hash"] == first["entry_hash"]
+
+    result = await verify_entry(db_session, UUID(second["id"]))
+
+    assert result["is_valid"] is True
+    assert result["entry_sequence"] == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_chain_after_append_many(db_session, test_org):
+    """A batch appended after an existing entry continues the same chain."""
+    ledger = ComplianceVaultLedger(db_session)
+    first = await ledger.append(test_org.id, "calculation", {"action": "first"})
+    batch = await ledger.append_many(
+        test_org.id,
+        "calculation",
+        [{"action": "batch", "seq": i} for i in range(3)],
+    )
+
+    assert [e["sequence_number"] for e in batch] == [2, 3, 4]
+    assert batch[0]["previous_hash"] == first["entry_hash"]
+    assert batch[2]["previous_hash"] == batch[1]["entry_hash"]
+
+    result = await verify_chain(db_session, test_org.id)
+
+    assert result["is_valid"] is True
+    assert result["entries_checked"] == 4
+
+    last = await verify_entry(db_session, UUID(batch[2]["id"]))
+    assert last["is_valid"] is True
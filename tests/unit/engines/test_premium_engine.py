@@ -10,7 +10,10 @@ from decimal import Decimal
 import pytest
 
 from engines.schemas.premium_engine import RegularRateInput
-from engines.services.regular_rate_calculator import calculate_regular_rate
+from engines.services.regular_rate_calculator import (
+    calculate_regular_rate,
+    calculate_tip_credit,
+)
 
 
 class TestRegularRateCalculation:
@@ -204,8 +207,6 @@ class TestTipCreditCalculation:
 
     def test_simple_tip_credit(self):
         """Test basic tip credit for tipped employee."""
-        from engines.services.regular_rate_calculator import calculate_tip_credit
-
         qualified, eligible, reason = calculate_tip_credit(
             total_tips=Decimal("500.00"),
             ttoc_code="12401",  # Server
@@ -219,8 +220,6 @@ class TestTipCreditCalculation:
 
     def test_no_ttoc_ineligible(self):
         """Test that employees without TTOC are ineligible."""
-        from engines.services.regular_rate_calculator import calculate_tip_credit
-
         qualified, eligible, reason = calculate_tip_credit(
             total_tips=Decimal("500.00"),
             ttoc_code=None,
@@ -234,8 +233,6 @@ class TestTipCreditCalculation:
 
     def test_dual_job_apportionment(self):
         """Test tip apportionment for dual-job employees."""
-        from engines.services.regular_rate_calculator import calculate_tip_credit
-
         # 30 hours tipped, 10 hours non-tipped = 75% tipped
         qualified, eligible, reason = calculate_tip_credit(
             total_tips=Decimal("400.00"),
@@ -0,0 +1,69 @@
+"""
+Notification Task Unit Tests
+
+Tests for the Redis dedup gate around notification emails: a claimed key
+is kept only when the email actually went out.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from backend.services import cache, email
+from workers.tasks import notification_tasks
+from workers.tasks.notification_tasks import (
+    _NotificationContext,
+    _async_send_phase_out_warning,
+)
+
+
+@pytest.fixture
+def dedup(monkeypatch):
+    """Stub the Redis claim and record which keys get released."""
+    released: list[str] = []
+
+    async def fake_claim(key: str, ttl: int) -> bool:
+        return True
+
+    async def fake_invalidate(key: str) -> bool:
+        released.append(key)
+        return True
+
+    monkeypatch.setattr(cache, "claim", fake_claim)
+    monkeypatch.setattr(cache, "invalidate", fake_invalidate)
+    return released
+
+
+def _stub_context(monkeypatch, email_address: str | None) -> None:
+    async def fake_context(org_id, **kwargs):
+        return _NotificationContext(email_address, "Test Org", "Jane Doe", "gusto")
+
+    monkeypatch.setattr(notification_tasks, "_get_notification_context", fake_context)
+
+
+class TestNotificationDedup:
+    async def test_failed_send_releases_claim(self, monkeypatch, dedup):
+        """A send that returns False leaves the alert free to retry."""
+        _stub_context(monkeypatch, "owner@example.com")
+        monkeypatch.setattr(email, "send_phase_out_warning_email", lambda **kwargs: False)
+        org_id, employee_id = uuid4(), uuid4()
+
+        await _async_send_phase_out_warning(org_id, employee_id, "80000", "75000")
+
+        assert dedup == [cache.notification_key("phase_out", org_id, employee_id)]
+
+    async def test_missing_recipient_releases_claim(self, monkeypatch, dedup):
+        _stub_context(monkeypatch, None)
+        org_id, employee_id = uuid4(), uuid4()
+
+        await _async_send_phase_out_warning(org_id, employee_id, "80000", "75000")
+
+        assert dedup == [cache.notification_key("phase_out", org_id, employee_id)]
+
+    async def test_successful_send_keeps_claim(self, monkeypatch, dedup):
+        _stub_context(monkeypatch, "owner@example.com")
+        monkeypatch.setattr(email, "send_phase_out_warning_email", lambda **kwargs: True)
+
+        await _async_send_phase_out_warning(uuid4(), uuid4(), "80000", "75000")
+
+        assert dedup == []
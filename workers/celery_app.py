@@ -5,10 +5,20 @@ Configures Celery with Redis broker and result backend.
 Defines task queues and routing.
 """
 
+import asyncio
+import logging
 import os
+import threading
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import (
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+
+logger = logging.getLogger(__name__)
 
 # Broker and backend URLs
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -33,10 +43,23 @@ app.conf.update(
     # Task behavior
     task_track_started=True,
     task_acks_late=True,
+    # Default for the long-running queues; the notifications worker raises
+    # it with --prefetch-multiplier since its tasks finish in milliseconds.
     worker_prefetch_multiplier=1,
-
-    # Result expiry
+    # With late acks, Redis redelivers anything unacked after this long.
+    # Keep it above the longest calculation batch so running tasks aren't
+    # handed to a second worker.
+    broker_transport_options={"visibility_timeout": 43200},  # 12 hours
+
+    # Results: most tasks are fire-and-forget, so only tasks that return
+    # something opt back in with ignore_result=False.
+    task_ignore_result=True,
     result_expires=86400,  # 24 hours
+    result_backend_transport_options={
+        "socket_keepalive": True,
+        "retry_on_timeout": True,
+    },
+    broker_connection_retry_on_startup=True,
 
     # Routing
     task_routes={
@@ -105,6 +128,88 @@ app.conf.beat_schedule = {
     },
 }
 
+# One event loop per worker process, running on its own thread and shared by
+# every task so the async engine's pooled connections are reused instead of
+# reopened per task. Tasks submit coroutines to it, so under --pool=threads
+# many in-flight tasks interleave their I/O on the same loop and pool.
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_loop_thread: threading.Thread | None = None
+_worker_loop_lock = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop when it is installed (uvicorn[standard] pulls it in)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the running worker loop, starting its thread on first use."""
+    global _worker_loop, _worker_loop_thread
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            _worker_loop = _new_event_loop()
+            _worker_loop_thread = threading.Thread(
+                target=_worker_loop.run_forever,
+                name="celery-worker-loop",
+                daemon=True,
+            )
+            _worker_loop_thread.start()
+        return _worker_loop
+
+
+def run_async(coro):
+    """Run an async function from a sync Celery task on the worker's loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """Drop pooled connections inherited from the parent and open a fresh one."""
+    from backend.db.session import engine
+
+    engine.sync_engine.dispose(close=False)
+    # Open one connection up front so the first task doesn't pay for the
+    # connect and TLS handshake. Celery gives process init only a few
+    # seconds, so an unreachable database just leaves the pool cold.
+    future = asyncio.run_coroutine_threadsafe(_warm_pool(engine), _get_worker_loop())
+    try:
+        future.result(timeout=2)
+    except Exception as exc:
+        future.cancel()
+        logger.warning(f"Database pool warm-up skipped: {exc!r}")
+
+
+async def _warm_pool(engine) -> None:
+    """Check out and return one pooled connection."""
+    async with engine.connect():
+        pass
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    """Close pooled DB and HTTP connections and stop the worker loop on exit."""
+    global _worker_loop, _worker_loop_thread
+    with _worker_loop_lock:
+        loop, thread = _worker_loop, _worker_loop_thread
+        _worker_loop = _worker_loop_thread = None
+    if loop is None or loop.is_closed():
+        return
+
+    from backend.db.session import engine
+    from integrations.base import close_shared_http_client
+
+    asyncio.run_coroutine_threadsafe(engine.dispose(), loop).result()
+    asyncio.run_coroutine_threadsafe(close_shared_http_client(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
 # Initialize Sentry for error monitoring in workers
 _sentry_dsn = os.getenv("SENTRY_DSN", "")
 if _sentry_dsn:
@@ -4,17 +4,36 @@ Calculation Tasks
 Background tasks for batch calculation processing.
 """
 
-import asyncio
 import logging
 from datetime import date
+from decimal import Decimal
 from uuid import UUID
 
-from workers.celery_app import app
+from celery import group
+
+from workers.celery_app import app, run_async
 
 logger = logging.getLogger(__name__)
 
+# Employees per chunk in a calculation batch. Each chunk's calculations and
+# vault entries are written together and committed with one progress update.
+CALCULATION_CHUNK_SIZE = 500
+
+# YTD gross wages above which the weekly check flags an employee as
+# approaching MAGI phase-out (served by ix_employees_active_ytd_wages).
+PHASE_OUT_WARNING_YTD_WAGES = Decimal("60000")
+
+# Decimal results from _calculate_single_employee recorded in the vault.
+_VAULT_FIELDS = (
+    "regular_hours",
+    "overtime_hours",
+    "regular_rate",
+    "qualified_ot_premium",
+    "phase_out_percentage",
+)
+
 
-@app.task(bind=True, max_retries=2, default_retry_delay=120)
+@app.task(bind=True, max_retries=2, default_retry_delay=120, ignore_result=False)
 def run_calculation_batch(
     self,
     organization_id: str,
@@ -38,7 +57,7 @@ def run_calculation_batch(
         f"for org {organization_id}"
     )
     try:
-        result = asyncio.get_event_loop().run_until_complete(
+        result = run_async(
             _async_run_calculation(
                 UUID(organization_id),
                 UUID(calculation_run_id),
@@ -61,7 +80,7 @@ def check_phase_out_risks():
     phase-out will apply.
     """
     logger.info("Running weekly phase-out risk check")
-    asyncio.get_event_loop().run_until_complete(_async_check_phase_outs())
+    run_async(_async_check_phase_outs())
 
 
 @app.task
@@ -73,7 +92,7 @@ def recalculate_employee(
 ):
     """Recalculate a single employee (e.g., after TTOC reclassification)."""
     logger.info(f"Recalculating employee {employee_id}")
-    asyncio.get_event_loop().run_until_complete(
+    run_async(
         _async_recalculate_employee(
             UUID(organization_id),
             UUID(employee_id),
@@ -101,7 +120,6 @@ async def _async_run_calculation(
     )
     from engines.services.magi_tracker import calculate_phase_out
     from compliance_vault.ledger import ComplianceVaultLedger
-    from decimal import Decimal
 
     async with get_async_session() as db:
         # Update run status
@@ -112,83 +130,95 @@ async def _async_run_calculation(
         )
         await db.commit()
 
-        # Get all employees
+        # Get all employees, loading only the columns the calculation reads
         emp_result = await db.execute(
-            select(Employee).where(
+            select(
+                Employee.id,
+                Employee.hourly_rate,
+                Employee.filing_status,
+                Employee.ytd_gross_wages,
+            ).where(
                 Employee.organization_id == org_id,
                 Employee.employment_status == "active",
             )
         )
-        employees = emp_result.scalars().all()
+        employees = emp_result.all()
 
         total = len(employees)
         completed = 0
         failed = 0
         results = []
 
+        # Totals are set once here and committed with the first chunk
+        await db.execute(
+            update(CalculationRun)
+            .where(CalculationRun.id == run_id)
+            .values(processed_employees=0, total_employees=total)
+        )
+
         vault = ComplianceVaultLedger(db)
 
-        for emp in employees:
-            try:
-                # Build calculation input from employee data
-                calc_result = await _calculate_single_employee(
-                    db, emp, period_start, period_end
-                )
+        for chunk_start in range(0, total, CALCULATION_CHUNK_SIZE):
+            chunk = employees[chunk_start:chunk_start + CALCULATION_CHUNK_SIZE]
+            calculations = []
+            vault_records = []
+
+            for emp in chunk:
+                try:
+                    # Build calculation input from employee data
+                    calc_result = await _calculate_single_employee(
+                        db, emp, period_start, period_end
+                    )
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Calculation failed for employee {emp.id}: {e}")
+                    results.append({
+                        "employee_id": str(emp.id),
+                        "status": "error",
+                        "error": str(e),
+                    })
+                    continue
 
                 # Create employee calculation record
-                emp_calc = EmployeeCalculation(
-                    calculation_run_id=run_id,
-                    employee_id=emp.id,
-                    **calc_result,
-                )
-                db.add(emp_calc)
-
-                # Record in vault
-                await vault.append_calculation(
-                    organization_id=org_id,
-                    calculation_run_id=run_id,
-                    employee_id=emp.id,
-                    calculation_data={
-                        k: str(v) if isinstance(v, Decimal) else v
-                        for k, v in calc_result.items()
-                        if k != "calculation_trace"
-                    },
+                calculations.append(
+                    EmployeeCalculation(
+                        calculation_run_id=run_id,
+                        employee_id=emp.id,
+                        **calc_result,
+                    )
                 )
+                vault_records.append((
+                    emp.id,
+                    {k: str(calc_result[k]) for k in _VAULT_FIELDS},
+                ))
 
                 completed += 1
                 results.append({"employee_id": str(emp.id), "status": "success"})
 
-            except Exception as e:
-                failed += 1
-                logger.error(f"Calculation failed for employee {emp.id}: {e}")
-                results.append({
-                    "employee_id": str(emp.id),
-                    "status": "error",
-                    "error": str(e),
-                })
-
-            # Update progress
-            if completed % 10 == 0:
-                await db.execute(
-                    update(CalculationRun)
-                    .where(CalculationRun.id == run_id)
-                    .values(
-                        processed_employees=completed + failed,
-                        total_employees=total,
-                    )
+            # Store the chunk's records and their vault entries together
+            db.add_all(calculations)
+            await vault.append_calculations(
+                organization_id=org_id,
+                calculation_run_id=run_id,
+                calculations=vault_records,
+            )
+
+            # Advance progress in the same commit as the chunk's records
+            await db.execute(
+                update(CalculationRun)
+                .where(CalculationRun.id == run_id)
+                .values(
+                    processed_employees=CalculationRun.processed_employees + len(chunk),
                 )
-                await db.commit()
+            )
+            await db.commit()
 
         # Finalize run
         final_status = "pending_approval" if failed == 0 else "error"
         await db.execute(
             update(CalculationRun)
             .where(CalculationRun.id == run_id)
-            .values(
-                status=final_status,
-                processed_employees=total,
-                total_employees=total,
-            )
+            .values(status=final_status)
         )
         await db.commit()
 
@@ -206,7 +236,12 @@ async def _calculate_single_employee(
     period_start: date,
     period_end: date,
 ) -> dict:
-    """Calculate OBBB values for a single employee."""
+    """
+    Calculate OBBB values for a single employee.
+
+    ``employee`` may be an Employee instance or a row carrying its ``id``,
+    ``hourly_rate``, ``filing_status`` and ``ytd_gross_wages`` columns.
+    """
     from engines.services.regular_rate_calculator import calculate_regular_rate
     from engines.services.magi_tracker import calculate_phase_out
     from engines.schemas.premium_engine import RegularRateInput
@@ -259,30 +294,44 @@ async def _calculate_single_employee(
 
 
 async def _async_check_phase_outs():
-    """Check all employees for phase-out risk."""
+    """Check all employees for phase-out risk and warn their organizations."""
     from backend.db.session import get_async_session
     from sqlalchemy import select
     from backend.models.employee import Employee
-    from backend.models.organization import Organization
+    from engines.services.magi_tracker import get_thresholds
+    from workers.tasks.notification_tasks import send_phase_out_warning
 
     async with get_async_session() as db:
         result = await db.execute(
-            select(Employee).where(Employee.employment_status == "active")
+            select(
+                Employee.id,
+                Employee.organization_id,
+                Employee.ytd_gross_wages,
+                Employee.filing_status,
+            ).where(
+                Employee.employment_status == "active",
+                Employee.ytd_gross_wages > PHASE_OUT_WARNING_YTD_WAGES,
+            )
+        )
+        at_risk = result.all()
+
+    if not at_risk:
+        return
+
+    logger.info(f"Phase-out risk: {len(at_risk)} employees flagged")
+
+    # Enqueue every warning as one group so the messages go out over a
+    # single producer connection instead of one round trip per .delay().
+    tax_year = date.today().year
+    group(
+        send_phase_out_warning.s(
+            str(org_id),
+            str(emp_id),
+            str(ytd),
+            str(get_thresholds(tax_year, filing_status or "single")[0]),
         )
-        employees = result.scalars().all()
-
-        at_risk = []
-        for emp in employees:
-            ytd = getattr(emp, "ytd_gross_wages", None)
-            if ytd and float(ytd) > 60000:  # Early warning threshold
-                at_risk.append({
-                    "employee_id": str(emp.id),
-                    "organization_id": str(emp.organization_id),
-                    "ytd_wages": str(ytd),
-                })
-
-        if at_risk:
-            logger.info(f"Phase-out risk: {len(at_risk)} employees flagged")
+        for emp_id, org_id, ytd, filing_status in at_risk
+    ).apply_async()
 
 
 async def _async_recalculate_employee(
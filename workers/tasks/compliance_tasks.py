@@ -7,10 +7,14 @@ Background tasks for compliance vault maintenance and audit operations.
 import asyncio
 import logging
 
-from workers.celery_app import app
+from workers.celery_app import app, run_async
 
 logger = logging.getLogger(__name__)
 
+# Organizations whose vaults are verified at the same time during maintenance.
+# Each holds one pooled connection for the length of its chain walk.
+VAULT_MAINTENANCE_CONCURRENCY = 8
+
 
 @app.task
 def vault_maintenance():
@@ -22,7 +26,7 @@ def vault_maintenance():
     - Generate retention reports
     """
     logger.info("Starting vault maintenance")
-    asyncio.get_event_loop().run_until_complete(_async_vault_maintenance())
+    run_async(_async_vault_maintenance())
 
 
 @app.task
@@ -30,12 +34,12 @@ def verify_vault_integrity(organization_id: str):
     """Verify vault integrity for a specific organization."""
     from uuid import UUID
     logger.info(f"Verifying vault for org {organization_id}")
-    asyncio.get_event_loop().run_until_complete(
+    run_async(
         _async_verify_org(UUID(organization_id))
     )
 
 
-@app.task
+@app.task(ignore_result=False)
 def generate_audit_pack_async(
     organization_id: str,
     tax_year: int,
@@ -43,7 +47,7 @@ def generate_audit_pack_async(
     """Generate audit pack in background."""
     from uuid import UUID
     logger.info(f"Generating audit pack for org {organization_id}, year {tax_year}")
-    result = asyncio.get_event_loop().run_until_complete(
+    result = run_async(
         _async_generate_pack(UUID(organization_id), tax_year)
     )
     return result
@@ -54,41 +58,60 @@ async def _async_vault_maintenance():
     from backend.db.session import get_async_session
     from sqlalchemy import select
     from backend.models.organization import Organization
-    from compliance_vault.integrity import verify_chain
-    from compliance_vault.retention import process_expired_entries, get_retention_summary
+    from compliance_vault.retention import process_expired_entries
 
     async with get_async_session() as db:
-        # Get all organizations
-        result = await db.execute(select(Organization))
-        orgs = result.scalars().all()
-
-        for org in orgs:
-            # Verify integrity
-            integrity = await verify_chain(db, org.id)
-            if not integrity["is_valid"]:
-                logger.error(
-                    f"VAULT INTEGRITY FAILURE for org {org.id}: "
-                    f"{integrity['message']}"
-                )
-                # TODO: Send alert notification
-            else:
-                logger.info(
-                    f"Vault OK for org {org.id}: "
-                    f"{integrity['entries_checked']} entries verified"
-                )
-
-            # Check retention
-            retention = await get_retention_summary(db, org.id)
-            if retention["expired"] > 0:
-                logger.info(
-                    f"Org {org.id}: {retention['expired']} entries eligible for cleanup"
-                )
+        # Get all organization ids
+        result = await db.execute(select(Organization.id))
+        org_ids = result.scalars().all()
+
+    # Each organization is checked on its own session; a few run at once so
+    # one tenant's chain walk overlaps another's round trips.
+    # One tenant's failure must not cancel the others or skip retention.
+    semaphore = asyncio.Semaphore(VAULT_MAINTENANCE_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *(_maintain_org_vault(org_id, semaphore) for org_id in org_ids),
+        return_exceptions=True,
+    )
+    for org_id, outcome in zip(org_ids, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Vault maintenance failed for org {org_id}: {outcome!r}")
 
+    async with get_async_session() as db:
         # Process expired entries (dry run by default)
         expired_result = await process_expired_entries(db, dry_run=True)
         logger.info(f"Retention check: {expired_result['message']}")
 
 
+async def _maintain_org_vault(org_id, semaphore: asyncio.Semaphore):
+    """Verify one organization's chain and report its retention status."""
+    from backend.db.session import get_async_session
+    from compliance_vault.integrity import verify_chain
+    from compliance_vault.retention import get_retention_summary
+
+    async with semaphore, get_async_session() as db:
+        # Verify integrity
+        integrity = await verify_chain(db, org_id)
+        if not integrity["is_valid"]:
+            logger.error(
+                f"VAULT INTEGRITY FAILURE for org {org_id}: "
+                f"{integrity['message']}"
+            )
+            # TODO: Send alert notification
+        else:
+            logger.info(
+                f"Vault OK for org {org_id}: "
+                f"{integrity['entries_checked']} entries verified"
+            )
+
+        # Check retention
+        retention = await get_retention_summary(db, org_id)
+        if retention["expired"] > 0:
+            logger.info(
+                f"Org {org_id}: {retention['expired']} entries eligible for cleanup"
+            )
+
+
 async def _async_verify_org(organization_id):
     """Verify vault for a single organization."""
     from backend.db.session import get_async_session
@@ -110,7 +133,13 @@ async def _async_verify_org(organization_id):
 
 
 async def _async_generate_pack(organization_id, tax_year):
-    """Generate audit pack asynchronously."""
+    """
+    Generate audit pack asynchronously.
+
+    Only the pack metadata and a per-section summary go back through the
+    result backend; the full pack is served on demand by the audit-pack
+    endpoint.
+    """
     from backend.db.session import get_async_session
     from compliance_vault.export import generate_audit_pack
 
@@ -124,4 +153,14 @@ async def _async_generate_pack(organization_id, tax_year):
             f"Audit pack generated for org {organization_id}: "
             f"{len(pack.get('sections', []))} sections"
         )
-        return pack
+        return {
+            "metadata": pack["metadata"],
+            "sections": [
+                {
+                    "title": section["title"],
+                    "type": section["type"],
+                    "count": section.get("count"),
+                }
+                for section in pack["sections"]
+            ],
+        }
@@ -7,79 +7,135 @@ Uses the email service for delivery with async DB lookups for context.
 
 import asyncio
 import logging
+import time
+from typing import NamedTuple
 from uuid import UUID
 
 from sqlalchemy import select
 
-from workers.celery_app import app
+from workers.celery_app import app, run_async
 
 logger = logging.getLogger(__name__)
 
 
-def _run_async(coro):
-    """Run an async function from a sync Celery task."""
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
-
-
-async def _get_org_contact(org_id: UUID) -> tuple[str | None, str]:
-    """Look up org contact email and name."""
+class _NotificationContext(NamedTuple):
+    """Recipient and display names for one notification email."""
+    email: str | None
+    org_name: str
+    employee_name: str
+    provider: str
+
+
+# Recently loaded notification contexts, keyed by (org, employee, integration).
+# The worker loop persists across tasks, so bursts of alerts for the same org
+# reuse one lookup; a changed contact email is picked up within the TTL.
+_CONTEXT_CACHE_TTL = 300.0
+_CONTEXT_CACHE_MAXSIZE = 1024
+# How long a notification about the same subject is suppressed after one is
+# sent, per notification kind (seconds).
+_DEDUP_TTL = {
+    "sync_failure": 3600,
+    "anomaly": 3600,
+    "phase_out": 86400,
+    "writeback": 60,
+}
+
+_context_cache: dict[
+    tuple[UUID, UUID | None, UUID | None], tuple[_NotificationContext, float]
+] = {}
+
+
+async def _get_notification_context(
+    org_id: UUID,
+    *,
+    employee_id: UUID | None = None,
+    integration_id: UUID | None = None,
+) -> _NotificationContext:
+    """
+    Look up the org contact, plus the employee name and integration
+    provider when given, in a single query.
+    """
     from backend.db.session import get_async_session
+    from backend.models.employee import Employee
+    from backend.models.integration import Integration
     from backend.models.organization import Organization
 
+    key = (org_id, employee_id, integration_id)
+    now = time.monotonic()
+    cached = _context_cache.get(key)
+    if cached is not None:
+        context, expires_at = cached
+        if expires_at > now:
+            return context
+        del _context_cache[key]
+
+    query = select(
+        Organization.primary_contact_email,
+        Organization.name,
+        Employee.first_name,
+        Employee.last_name,
+        Integration.provider,
+    ).where(Organization.id == org_id)
+    query = query.outerjoin(
+        Employee,
+        (Employee.id == employee_id) & (Employee.organization_id == Organization.id),
+    ).outerjoin(
+        Integration,
+        (Integration.id == integration_id)
+        & (Integration.organization_id == Organization.id),
+    )
+
     async with get_async_session() as session:
-        result = await session.execute(
-            select(Organization.primary_contact_email, Organization.name)
-            .where(Organization.id == org_id)
-        )
-        row = result.first()
-        if row and row[0]:
-            return row[0], row[1]
-        return None, row[1] if row else ""
+        row = (await session.execute(query)).first()
 
+    if not row:
+        return _NotificationContext(None, "", "Unknown Employee", "Unknown Provider")
 
-async def _get_employee_name(employee_id: UUID) -> str:
-    """Look up employee full name."""
-    from backend.db.session import get_async_session
-    from backend.models.employee import Employee
+    email, org_name, first_name, last_name, provider = row
+    employee_name = (
+        f"{first_name} {last_name}" if first_name is not None else "Unknown Employee"
+    )
+    context = _NotificationContext(
+        email or None, org_name, employee_name, provider or "Unknown Provider"
+    )
 
-    async with get_async_session() as session:
-        result = await session.execute(
-            select(Employee.first_name, Employee.last_name)
-            .where(Employee.id == employee_id)
-        )
-        row = result.first()
-        if row:
-            return f"{row[0]} {row[1]}"
-        return "Unknown Employee"
+    if len(_context_cache) >= _CONTEXT_CACHE_MAXSIZE:
+        # Dicts keep insertion order, so this evicts the oldest entry.
+        del _context_cache[next(iter(_context_cache))]
+    _context_cache[key] = (context, now + _CONTEXT_CACHE_TTL)
+    return context
 
 
-async def _get_integration_provider(integration_id: UUID) -> str:
-    """Look up integration provider name."""
-    from backend.db.session import get_async_session
-    from backend.models.integration import Integration
+async def _claim_notification(kind: str, *parts) -> str | None:
+    """
+    Claim the dedup key for a ``kind`` notification about ``parts``.
 
-    async with get_async_session() as session:
-        result = await session.execute(
-            select(Integration.provider)
-            .where(Integration.id == integration_id)
-        )
-        row = result.first()
-        return row[0] if row else "Unknown Provider"
+    Returns the claimed key, or None when the same notification already went
+    out inside the kind's window, so repeats return before touching Postgres
+    or the email provider. Callers release the key if nothing was delivered.
+    """
+    from backend.services.cache import claim, notification_key
+
+    key = notification_key(kind, *parts)
+    if await claim(key, _DEDUP_TTL[kind]):
+        return key
+    logger.info(f"Skipping duplicate {kind} notification for {parts}")
+    return None
+
+
+async def _release_notification(key: str | None) -> None:
+    """Drop a dedup key so an undelivered notification can be sent again."""
+    from backend.services.cache import invalidate
+
+    if key is not None:
+        await invalidate(key)
 
 
 @app.task
 def send_approval_reminder(organization_id: str, run_id: str):
     """Send reminder that a calculation run is pending approval."""
     logger.info(f"Sending approval reminder for run {run_id}")
-    _run_async(_async_send_approval_reminder(UUID(organization_id), run_id))
+    run_async(_async_send_approval_reminder(UUID(organization_id), run_id))
 
 
 @app.task
@@ -93,7 +149,7 @@ def send_sync_failure_alert(
         f"Sync failure alert: org={organization_id}, "
         f"integration={integration_id}, error={error_message}"
     )
-    _run_async(
+    run_async(
         _async_send_sync_alert(
             UUID(organization_id), UUID(integration_id), error_message
         )
@@ -112,7 +168,7 @@ def send_anomaly_alert(
         f"Anomaly detected: org={organization_id}, "
         f"employee={employee_id}, type={anomaly_type}"
     )
-    _run_async(
+    run_async(
         _async_send_anomaly_alert(
             UUID(organization_id), UUID(employee_id), anomaly_type,
             details.get("description", str(details)),
@@ -132,7 +188,7 @@ def send_phase_out_warning(
         f"Phase-out warning: employee={employee_id}, "
         f"MAGI={current_magi}, threshold={threshold}"
     )
-    _run_async(
+    run_async(
         _async_send_phase_out_warning(
             UUID(organization_id), UUID(employee_id), current_magi, threshold
         )
@@ -150,9 +206,10 @@ def send_write_back_confirmation(
     logger.info(
         f"Write-back confirmed: org={organization_id}, records={records_count}"
     )
-    _run_async(
+    run_async(
         _async_send_writeback_confirmation(
-            UUID(organization_id), records_count, provider
+            UUID(organization_id), records_count, provider,
+            batch_summary.get("batch_id"),
         )
     )
 
@@ -164,14 +221,15 @@ async def _async_send_approval_reminder(org_id: UUID, run_id: str):
     """Send approval reminder email."""
     from backend.services.email import send_approval_reminder_email
 
-    email, org_name = await _get_org_contact(org_id)
-    if not email:
+    context = await _get_notification_context(org_id)
+    if not context.email:
         logger.warning(f"No contact email for org {org_id}, skipping approval reminder")
         return
 
-    send_approval_reminder_email(
-        to_email=email,
-        org_name=org_name,
+    await asyncio.to_thread(
+        send_approval_reminder_email,
+        to_email=context.email,
+        org_name=context.org_name,
         run_id=run_id,
         period="Current Period",
     )
@@ -181,18 +239,27 @@ async def _async_send_sync_alert(org_id: UUID, integration_id: UUID, error_messa
     """Send sync failure alert email."""
     from backend.services.email import send_sync_failure_email
 
-    email, org_name = await _get_org_contact(org_id)
-    if not email:
-        logger.warning(f"No contact email for org {org_id}, skipping sync alert")
+    key = await _claim_notification("sync_failure", org_id, integration_id)
+    if key is None:
         return
 
-    provider = await _get_integration_provider(integration_id)
-    send_sync_failure_email(
-        to_email=email,
-        org_name=org_name,
-        provider=provider,
-        error_message=error_message,
-    )
+    sent = False
+    try:
+        context = await _get_notification_context(org_id, integration_id=integration_id)
+        if not context.email:
+            logger.warning(f"No contact email for org {org_id}, skipping sync alert")
+            return
+
+        sent = await asyncio.to_thread(
+            send_sync_failure_email,
+            to_email=context.email,
+            org_name=context.org_name,
+            provider=context.provider,
+            error_message=error_message,
+        )
+    finally:
+        if not sent:
+            await _release_notification(key)
 
 
 async def _async_send_anomaly_alert(
@@ -201,19 +268,28 @@ async def _async_send_anomaly_alert(
     """Send anomaly alert email."""
     from backend.services.email import send_anomaly_alert_email
 
-    email, org_name = await _get_org_contact(org_id)
-    if not email:
-        logger.warning(f"No contact email for org {org_id}, skipping anomaly alert")
+    key = await _claim_notification("anomaly", org_id, employee_id, anomaly_type)
+    if key is None:
         return
 
-    employee_name = await _get_employee_name(employee_id)
-    send_anomaly_alert_email(
-        to_email=email,
-        org_name=org_name,
-        employee_name=employee_name,
-        anomaly_type=anomaly_type,
-        details=details,
-    )
+    sent = False
+    try:
+        context = await _get_notification_context(org_id, employee_id=employee_id)
+        if not context.email:
+            logger.warning(f"No contact email for org {org_id}, skipping anomaly alert")
+            return
+
+        sent = await asyncio.to_thread(
+            send_anomaly_alert_email,
+            to_email=context.email,
+            org_name=context.org_name,
+            employee_name=context.employee_name,
+            anomaly_type=anomaly_type,
+            details=details,
+        )
+    finally:
+        if not sent:
+            await _release_notification(key)
 
 
 async def _async_send_phase_out_warning(
@@ -222,35 +298,56 @@ async def _async_send_phase_out_warning(
     """Send phase-out warning email."""
     from backend.services.email import send_phase_out_warning_email
 
-    email, org_name = await _get_org_contact(org_id)
-    if not email:
-        logger.warning(f"No contact email for org {org_id}, skipping phase-out warning")
+    key = await _claim_notification("phase_out", org_id, employee_id)
+    if key is None:
         return
 
-    employee_name = await _get_employee_name(employee_id)
-    send_phase_out_warning_email(
-        to_email=email,
-        org_name=org_name,
-        employee_name=employee_name,
-        current_magi=current_magi,
-        threshold=threshold,
-    )
+    sent = False
+    try:
+        context = await _get_notification_context(org_id, employee_id=employee_id)
+        if not context.email:
+            logger.warning(f"No contact email for org {org_id}, skipping phase-out warning")
+            return
+
+        sent = await asyncio.to_thread(
+            send_phase_out_warning_email,
+            to_email=context.email,
+            org_name=context.org_name,
+            employee_name=context.employee_name,
+            current_magi=current_magi,
+            threshold=threshold,
+        )
+    finally:
+        if not sent:
+            await _release_notification(key)
 
 
 async def _async_send_writeback_confirmation(
-    org_id: UUID, records_count: int, provider: str,
+    org_id: UUID, records_count: int, provider: str, batch_id: str | None = None,
 ):
     """Send write-back confirmation email."""
     from backend.services.email import send_writeback_confirmation_email
 
-    email, org_name = await _get_org_contact(org_id)
-    if not email:
-        logger.warning(f"No contact email for org {org_id}, skipping writeback confirmation")
-        return
+    key = None
+    if batch_id:
+        key = await _claim_notification("writeback", org_id, batch_id)
+        if key is None:
+            return
 
-    send_writeback_confirmation_email(
-        to_email=email,
-        org_name=org_name,
-        records_count=records_count,
-        provider=provider,
-    )
+    sent = False
+    try:
+        context = await _get_notification_context(org_id)
+        if not context.email:
+            logger.warning(f"No contact email for org {org_id}, skipping writeback confirmation")
+            return
+
+        sent = await asyncio.to_thread(
+            send_writeback_confirmation_email,
+            to_email=context.email,
+            org_name=context.org_name,
+            records_count=records_count,
+            provider=provider,
+        )
+    finally:
+        if not sent:
+            await _release_notification(key)
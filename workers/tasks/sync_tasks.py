@@ -4,17 +4,23 @@ Sync Tasks
 Background tasks for syncing data from external integrations.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from uuid import UUID
 
-from workers.celery_app import app
+from celery import group
+
+from workers.celery_app import app, run_async
 
 logger = logging.getLogger(__name__)
 
+# A sync still marked "syncing" after this long is treated as abandoned: the
+# stale check re-enqueues it and a new sync may take it over.
+STALE_SYNC_AFTER = timedelta(hours=2)
+
 
-@app.task(bind=True, max_retries=3, default_retry_delay=60)
+@app.task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=False)
 def sync_integration(self, integration_id: str):
     """
     Sync a single integration.
@@ -23,7 +29,7 @@ def sync_integration(self, integration_id: str):
     """
     logger.info(f"Starting sync for integration {integration_id}")
     try:
-        result = asyncio.get_event_loop().run_until_complete(
+        result = run_async(
             _async_sync_integration(UUID(integration_id))
         )
         logger.info(
@@ -40,37 +46,35 @@ def sync_integration(self, integration_id: str):
 def sync_all_payroll():
     """Sync all active payroll integrations."""
     logger.info("Starting payroll sync for all organizations")
-    asyncio.get_event_loop().run_until_complete(_async_sync_by_category("payroll"))
+    run_async(_async_sync_by_category("payroll"))
 
 
 @app.task
 def sync_all_pos():
     """Sync all active POS integrations."""
     logger.info("Starting POS sync for all organizations")
-    asyncio.get_event_loop().run_until_complete(_async_sync_by_category("pos"))
+    run_async(_async_sync_by_category("pos"))
 
 
 @app.task
 def sync_all_timekeeping():
     """Sync all active timekeeping integrations."""
     logger.info("Starting timekeeping sync for all organizations")
-    asyncio.get_event_loop().run_until_complete(_async_sync_by_category("timekeeping"))
+    run_async(_async_sync_by_category("timekeeping"))
 
 
 @app.task
 def check_stale_integrations():
     """Check for integrations that haven't synced recently."""
     logger.info("Checking for stale integrations")
-    asyncio.get_event_loop().run_until_complete(_async_check_stale())
+    run_async(_async_check_stale())
 
 
 async def _async_sync_integration(integration_id: UUID) -> dict:
     """Async implementation of integration sync."""
     from backend.db.session import get_async_session
-    from sqlalchemy import select, update
+    from sqlalchemy import or_, select, update
     from backend.models.integration import Integration
-    from backend.config import get_settings
-    from integrations.oauth_manager import OAuthTokenManager
 
     async with get_async_session() as db:
         # Get integration record
@@ -84,15 +88,31 @@ async def _async_sync_integration(integration_id: UUID) -> dict:
         if not integration.is_connected:
             return {"error": "Integration is inactive"}
 
-        # Update sync status
-        integration.last_sync_status = "syncing"
-        integration.last_sync_at = datetime.utcnow()
+        # Claim the integration by marking it as syncing, unless another
+        # worker is already mid-sync on it; two syncs would both refresh the
+        # OAuth token and race on the cursor. The start time also becomes
+        # the new sync cursor, so changes made upstream while this sync runs
+        # are picked up by the next one.
+        now = datetime.utcnow()
+        claim = await db.execute(
+            update(Integration)
+            .where(
+                Integration.id == integration_id,
+                or_(
+                    Integration.last_sync_status.is_distinct_from("syncing"),
+                    Integration.last_sync_at < now - STALE_SYNC_AFTER,
+                ),
+            )
+            .values(last_sync_status="syncing", last_sync_at=now)
+        )
         await db.commit()
+        if claim.rowcount == 0:
+            logger.info(f"Sync already in progress for {integration_id}, skipping")
+            return {"skipped": "in_progress"}
 
         try:
             # Decrypt tokens and create client
-            settings = get_settings()
-            token_manager = OAuthTokenManager(settings.encryption_key)
+            token_manager = _token_manager()
 
             access_token, refresh_token = token_manager.decrypt_tokens(
                 integration.access_token_encrypted,
@@ -101,22 +121,35 @@ async def _async_sync_integration(integration_id: UUID) -> dict:
 
             # Check if token needs refresh
             if token_manager.needs_refresh(integration.token_expires_at):
-                client = _create_client(
-                    integration.provider, access_token, refresh_token,
-                    integration.provider_metadata or {},
-                )
-                new_access, new_refresh, expires_in = await client.refresh_access_token()
-                enc_access, enc_refresh = token_manager.encrypt_tokens(
-                    new_access, new_refresh
-                )
-                integration.access_token_encrypted = enc_access
-                integration.refresh_token_encrypted = enc_refresh
-                if expires_in:
-                    integration.token_expires_at = (
-                        datetime.utcnow() + timedelta(seconds=expires_in)
+                # Lock the row and re-check: a concurrent sync of the same
+                # integration may already have refreshed it, and refreshing
+                # twice can revoke the other worker's rotated refresh token.
+                await db.refresh(integration, with_for_update=True)
+                if token_manager.needs_refresh(integration.token_expires_at):
+                    client = _create_client(
+                        integration.provider, access_token, refresh_token,
+                        integration.provider_metadata or {},
+                    )
+                    new_access, new_refresh, expires_in = await client.refresh_access_token()
+                    await client.close()
+                    new_refresh = new_refresh or refresh_token
+                    enc_access, enc_refresh = token_manager.encrypt_tokens(
+                        new_access, new_refresh
+                    )
+                    integration.access_token_encrypted = enc_access
+                    integration.refresh_token_encrypted = enc_refresh
+                    if expires_in:
+                        integration.token_expires_at = (
+                            now + timedelta(seconds=expires_in)
+                        )
+                    access_token, refresh_token = new_access, new_refresh
+                else:
+                    access_token, refresh_token = token_manager.decrypt_tokens(
+                        integration.access_token_encrypted,
+                        integration.refresh_token_encrypted,
                     )
-                access_token = new_access
-                await client.close()
+                # Release the row lock before the long-running sync
+                await db.commit()
 
             # Create integration client
             client = _create_client(
@@ -132,7 +165,7 @@ async def _async_sync_integration(integration_id: UUID) -> dict:
 
             # Update sync cursor
             cursor = integration.sync_cursor or {}
-            cursor["last_employee_sync"] = datetime.utcnow().isoformat()
+            cursor["last_employee_sync"] = now.isoformat()
             integration.sync_cursor = cursor
             integration.last_sync_status = "success" if sync_result.success else "failed"
 
@@ -146,8 +179,14 @@ async def _async_sync_integration(integration_id: UUID) -> dict:
                 "errors": sync_result.errors,
             }
 
-        except Exception as e:
-            integration.last_sync_status = "failed"
+        except Exception:
+            # Roll back first so a poisoned session can't keep the claim held
+            await db.rollback()
+            await db.execute(
+                update(Integration)
+                .where(Integration.id == integration_id)
+                .values(last_sync_status="failed")
+            )
             await db.commit()
             raise
 
@@ -167,8 +206,7 @@ async def _async_sync_by_category(category: str):
         )
         integration_ids = result.scalars().all()
 
-    for int_id in integration_ids:
-        sync_integration.delay(str(int_id))
+    group(sync_integration.s(str(int_id)) for int_id in integration_ids).apply_async()
 
 
 async def _async_check_stale():
@@ -177,11 +215,16 @@ async def _async_check_stale():
     from sqlalchemy import select, or_
     from backend.models.integration import Integration
 
-    stale_threshold = datetime.utcnow() - timedelta(hours=2)
+    stale_threshold = datetime.utcnow() - STALE_SYNC_AFTER
 
     async with get_async_session() as db:
         result = await db.execute(
-            select(Integration).where(
+            select(
+                Integration.id,
+                Integration.provider,
+                Integration.organization_id,
+                Integration.last_sync_at,
+            ).where(
                 Integration.status == "connected",
                 or_(
                     Integration.last_sync_at < stale_threshold,
@@ -189,27 +232,42 @@ async def _async_check_stale():
                 ),
             )
         )
-        stale = result.scalars().all()
+        stale = result.all()
 
-        for integration in stale:
-            logger.warning(
-                f"Stale integration: {integration.provider} "
-                f"(org={integration.organization_id}, "
-                f"last_sync={integration.last_sync_at})"
-            )
-            # Trigger a sync
-            sync_integration.delay(str(integration.id))
+    if not stale:
+        return
 
+    logger.warning(f"Stale integrations: {len(stale)} overdue for sync")
+    for integration in stale:
+        logger.debug(
+            f"Stale integration: {integration.provider} "
+            f"(org={integration.organization_id}, "
+            f"last_sync={integration.last_sync_at})"
+        )
 
-def _create_client(provider: str, access_token: str, refresh_token: str | None, config: dict):
-    """Factory for creating integration clients."""
+    # Trigger their syncs in one publish
+    group(sync_integration.s(str(integration.id)) for integration in stale).apply_async()
+
+
+@lru_cache
+def _token_manager():
+    """Token manager for the configured encryption key, built once per process."""
+    from backend.config import get_settings
+    from integrations.oauth_manager import OAuthTokenManager
+
+    return OAuthTokenManager(get_settings().encryption_key)
+
+
+@lru_cache
+def _client_registry() -> dict[str, type]:
+    """Map provider names to integration classes, importing them once."""
     from integrations.payroll.adp import ADPIntegration
     from integrations.payroll.gusto import GustoIntegration
     from integrations.payroll.paychex import PaychexIntegration
     from integrations.payroll.quickbooks_payroll import QuickBooksPayrollIntegration
     from integrations.pos.toast import ToastIntegration
 
-    clients = {
+    return {
         "adp": ADPIntegration,
         "gusto": GustoIntegration,
         "paychex": PaychexIntegration,
@@ -217,7 +275,10 @@ def _create_client(provider: str, access_token: str, refresh_token: str | None,
         "toast": ToastIntegration,
     }
 
-    cls = clients.get(provider)
+
+def _create_client(provider: str, access_token: str, refresh_token: str | None, config: dict):
+    """Factory for creating integration clients."""
+    cls = _client_registry().get(provider)
     if not cls:
         raise ValueError(f"Unknown provider: {provider}")
     return cls(access_token=access_token, refresh_token=refresh_token, config=config)